@@ -8,10 +8,15 @@ from .use_cases import (
     DataExportUseCase,
     JobManagementUseCase
 )
+from .id_generator import IdGenerator, generate_id
+from .schema_validator import schema_validator_factory
 
 __all__ = [
     'FileUploadUseCase',
     'DataTransformationUseCase',
     'DataExportUseCase',
-    'JobManagementUseCase'
+    'JobManagementUseCase',
+    'IdGenerator',
+    'generate_id',
+    'schema_validator_factory'
 ]
@@ -2,7 +2,6 @@
 Application layer use cases for AI Review & Approve workflow.
 """
 
-import uuid
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
@@ -10,10 +9,12 @@ from ..domain.change_request import (
     ChangeRequest,
     ChangeSuggestion,
     CellChange,
+    CellChangeBatch,
     ChangeStatus,
     ChangeType
 )
 from ..domain.exceptions import DomainError
+from .id_generator import generate_id
 
 
 class AIReviewUseCase:
@@ -49,7 +50,7 @@ class AIReviewUseCase:
             ChangeRequest with AI suggestions
         """
         # Create change request
-        request_id = str(uuid.uuid4())
+        request_id = generate_id()
         request = ChangeRequest(
             request_id=request_id,
             file_id=file_id,
@@ -112,11 +113,7 @@ class AIReviewUseCase:
             raise DomainError(f"Cannot approve request with status: {request.status.value}")
         
         # Verify suggestion exists
-        suggestion = None
-        for s in request.suggestions:
-            if s.suggestion_id == suggestion_id:
-                suggestion = s
-                break
+        suggestion = request.get_suggestion(suggestion_id)
         
         if not suggestion:
             raise DomainError(f"Suggestion not found: {suggestion_id}")
@@ -171,23 +168,40 @@ class AIReviewUseCase:
             raise DomainError("No suggestion selected for application")
         
         try:
+            # Convert once so check, preview and apply share the same columns
+            batch = CellChangeBatch.from_list(suggestion.changes)
+            
             # Check if changes can be applied
-            if not self.change_applier.can_apply(suggestion.changes):
+            if not self.change_applier.can_apply(batch):
                 raise DomainError("Changes cannot be applied to file")
             
-            # Get preview of changes
-            preview = self.change_applier.preview_changes(
-                request.file_id,
-                request.sheet_id,
-                suggestion.changes
-            )
-            
-            # Apply changes
-            success = self.change_applier.apply_changes(
-                request.file_id,
-                request.sheet_id,
-                suggestion.changes
-            )
+            # Prefer the applier's async variants when it has them
+            if (hasattr(self.change_applier, 'preview_changes_async')
+                    and hasattr(self.change_applier, 'apply_changes_async')):
+                preview = await self.change_applier.preview_changes_async(
+                    request.file_id,
+                    request.sheet_id,
+                    batch
+                )
+                success = await self.change_applier.apply_changes_async(
+                    request.file_id,
+                    request.sheet_id,
+                    batch
+                )
+            else:
+                # Get preview of changes
+                preview = self.change_applier.preview_changes(
+                    request.file_id,
+                    request.sheet_id,
+                    batch
+                )
+                
+                # Apply changes
+                success = self.change_applier.apply_changes(
+                    request.file_id,
+                    request.sheet_id,
+                    batch
+                )
             
             if not success:
                 raise DomainError("Failed to apply changes")
@@ -235,11 +249,7 @@ class AIReviewUseCase:
         
         # Get suggestion to preview
         if suggestion_id:
-            suggestion = None
-            for s in request.suggestions:
-                if s.suggestion_id == suggestion_id:
-                    suggestion = s
-                    break
+            suggestion = request.get_suggestion(suggestion_id)
         else:
             suggestion = request.get_selected_suggestion()
         
@@ -0,0 +1,60 @@
+"""
+Sortable ID generation for jobs, change requests and suggestions.
+"""
+
+import os
+import threading
+import time
+
+
+class IdGenerator:
+    """
+    ULID-like ID generator.
+
+    IDs are 32 hex characters: a 48-bit millisecond timestamp followed by
+    80 bits of entropy. Entropy is drawn from a buffered os.urandom block so
+    the syscall is amortized across many IDs, and IDs generated within the
+    same millisecond are monotonically increasing, so IDs sort by creation
+    order.
+    """
+
+    BUFFER_SIZE = 1024
+    ENTROPY_BYTES = 10
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buffer = b''
+        self._offset = 0
+        self._last_ms = -1
+        self._last_entropy = 0
+
+    def _next_entropy(self) -> int:
+        """Take the next entropy chunk, refilling the buffer when exhausted."""
+        end = self._offset + self.ENTROPY_BYTES
+        if end > len(self._buffer):
+            self._buffer = os.urandom(self.BUFFER_SIZE)
+            self._offset = 0
+            end = self.ENTROPY_BYTES
+        chunk = self._buffer[self._offset:end]
+        self._offset = end
+        return int.from_bytes(chunk, 'big')
+
+    def generate(self) -> str:
+        """Generate a new sortable ID."""
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms == self._last_ms:
+                entropy = (self._last_entropy + 1) & ((1 << 80) - 1)
+            else:
+                entropy = self._next_entropy()
+                self._last_ms = now_ms
+            self._last_entropy = entropy
+        return f"{now_ms:012x}{entropy:020x}"
+
+
+_default_generator = IdGenerator()
+
+
+def generate_id() -> str:
+    """Generate a sortable ID using the shared generator."""
+    return _default_generator.generate()
@@ -0,0 +1,168 @@
+"""
+Schema validation for uploaded data.
+
+Validators are generated per schema: only the checks a ColumnSchema
+actually declares (nullability, bounds, allowed values, pattern) are
+emitted, so validating a frame does no per-column branching on unset
+constraints. Generated validators are cached by schema.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+from ..domain import ColumnSchema, ValidationResult, ValidationStatus
+
+
+# ColumnSchema dtype names mapped to compact codes for the schema type check
+_DTYPE_CODES = {'int': 0, 'float': 1, 'str': 2, 'datetime': 3, 'bool': 4, 'category': 5}
+
+# numpy dtype.kind -> ColumnSchema dtype code
+_KIND_CODES = {'i': 0, 'u': 0, 'f': 1, 'O': 2, 'U': 2, 'S': 2, 'M': 3, 'b': 4}
+
+_VALIDATOR_CACHE: Dict[Any, Callable[[Any], ValidationResult]] = {}
+
+
+def _dtype_code(dtype) -> int:
+    """Encode a pandas dtype as a ColumnSchema dtype code (-1 if unknown)."""
+    if getattr(dtype, 'name', None) == 'category':
+        return _DTYPE_CODES['category']
+    if getattr(dtype, 'name', None) == 'string':
+        return _DTYPE_CODES['str']
+    return _KIND_CODES.get(getattr(dtype, 'kind', ''), -1)
+
+
+def _schema_key(schema: List[ColumnSchema]) -> Optional[tuple]:
+    """Hashable cache key for a schema, or None if a constraint is unhashable."""
+    key = tuple(
+        (
+            c.name, c.dtype, c.required, c.nullable, c.min_value, c.max_value,
+            tuple(c.allowed_values) if c.allowed_values is not None else None,
+            c.regex_pattern
+        )
+        for c in schema
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _generate_source(schema: List[ColumnSchema]) -> str:
+    """Emit validator source for a schema. Values are referenced by name, never inlined."""
+    lines = [
+        "def _validate(df):",
+        "    errors = []",
+        "    col_set = frozenset(df.columns.values.tolist())",
+        "    name_to_dtype = dict(zip(df.columns, df.dtypes))",
+    ]
+
+    for i, col in enumerate(schema):
+        expected = _DTYPE_CODES[col.dtype]
+        lines.append(f"    if _name{i} not in col_set:")
+        if col.required:
+            lines.append(f"        errors.append('Missing required column: ' + str(_name{i}))")
+        else:
+            lines.append("        pass")
+        lines.append("    else:")
+        lines.append(f"        dtype = name_to_dtype[_name{i}]")
+        lines.append("        code = _dtype_code(dtype)")
+
+        type_ok = f"code == {expected}"
+        if col.nullable and col.dtype == 'int':
+            # Nullable integer columns are stored as float by pandas
+            type_ok = f"code in ({expected}, {_DTYPE_CODES['float']})"
+        lines.append(f"        if not ({type_ok}):")
+        lines.append(
+            f"            errors.append('Invalid type for column ' + str(_name{i}) + "
+            f"': expected {col.dtype}, got ' + str(dtype))"
+        )
+
+        checks = []
+        if not col.nullable:
+            checks += [
+                "if series.isna().any():",
+                f"    errors.append('Null values in non-nullable column: ' + str(_name{i}))",
+            ]
+        has_value_checks = (
+            col.min_value is not None or col.max_value is not None
+            or col.allowed_values is not None or col.regex_pattern is not None
+        )
+        if has_value_checks:
+            checks.append("values = series.dropna()")
+        if col.min_value is not None:
+            checks += [
+                f"if (values < _min{i}).any():",
+                f"    errors.append('Values below minimum in column ' + str(_name{i}))",
+            ]
+        if col.max_value is not None:
+            checks += [
+                f"if (values > _max{i}).any():",
+                f"    errors.append('Values above maximum in column ' + str(_name{i}))",
+            ]
+        if col.allowed_values is not None:
+            checks += [
+                f"if not values.isin(_allowed{i}).all():",
+                f"    errors.append('Values not allowed in column ' + str(_name{i}))",
+            ]
+        if col.regex_pattern is not None:
+            checks += [
+                f"if not values.astype(str).str.fullmatch(_regex{i}).all():",
+                f"    errors.append('Values not matching pattern in column ' + str(_name{i}))",
+            ]
+
+        if checks:
+            # Value constraints only make sense once the dtype matches
+            lines.append("        else:")
+            lines.append(f"            series = df[_name{i}]")
+            lines.extend("            " + check for check in checks)
+
+    lines += [
+        "    if errors:",
+        "        return ValidationResult(",
+        "            status=ValidationStatus.INVALID,",
+        "            message='Schema validation failed',",
+        "            details={'errors': errors}",
+        "        )",
+        "    return ValidationResult(",
+        "        status=ValidationStatus.VALID,",
+        "        message='Schema validation passed'",
+        "    )",
+    ]
+    return "\n".join(lines)
+
+
+def schema_validator_factory(schema: List[ColumnSchema]) -> Callable[[Any], ValidationResult]:
+    """
+    Get a validator function specialized for a schema.
+
+    Args:
+        schema: Expected column schema
+
+    Returns:
+        Function taking a DataFrame and returning a ValidationResult
+    """
+    key = _schema_key(schema)
+    if key is not None:
+        cached = _VALIDATOR_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+    namespace: Dict[str, Any] = {
+        '_dtype_code': _dtype_code,
+        'ValidationResult': ValidationResult,
+        'ValidationStatus': ValidationStatus,
+    }
+    for i, col in enumerate(schema):
+        namespace[f'_name{i}'] = col.name
+        namespace[f'_min{i}'] = col.min_value
+        namespace[f'_max{i}'] = col.max_value
+        namespace[f'_allowed{i}'] = col.allowed_values
+        namespace[f'_regex{i}'] = col.regex_pattern
+
+    code = compile(_generate_source(schema), '<schema_validator>', 'exec')
+    exec(code, namespace)
+    validator = namespace['_validate']
+
+    if key is not None:
+        _VALIDATOR_CACHE[key] = validator
+    return validator
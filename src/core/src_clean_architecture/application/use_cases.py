@@ -4,8 +4,8 @@ This layer orchestrates domain objects to perform specific tasks.
 It depends only on the Domain layer.
 """
 
-from typing import List, Optional, Dict, Any
-import uuid
+import copy
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Union
 from datetime import datetime
 
 from ..domain import (
@@ -17,6 +17,8 @@ from ..domain import (
     ColumnSchema
 )
 from ..domain.entities import ProcessingJob, ProcessingPipeline
+from .id_generator import generate_id
+from .schema_validator import schema_validator_factory
 from ..domain.exceptions import (
     FileValidationError,
     ParsingError,
@@ -31,11 +33,13 @@ class FileUploadUseCase:
         self,
         file_validator,
         file_parser,
-        repository
+        repository,
+        job_repository=None
     ):
         self.file_validator = file_validator
         self.file_parser = file_parser
         self.repository = repository
+        self.job_repository = job_repository
     
     def execute(
         self, 
@@ -55,7 +59,7 @@ class FileUploadUseCase:
             ProcessingJob with validation results
         """
         # Generate job ID
-        job_id = str(uuid.uuid4())
+        job_id = generate_id()
         
         # Validate file
         validation_result = self.file_validator.validate_file(file_path, filename)
@@ -75,7 +79,7 @@ class FileUploadUseCase:
         # If valid, parse file
         if validation_result.is_valid:
             try:
-                data = self.file_parser.parse(file_path)
+                data = self._parse_and_store(file_path, job_id)
                 job.add_result(data)
                 
                 # Validate schema if provided
@@ -83,9 +87,6 @@ class FileUploadUseCase:
                     schema_validation = self._validate_schema(data, expected_schema)
                     job.add_validation(schema_validation)
                 
-                # Save to repository
-                self.repository.save(data, job_id)
-                
             except Exception as e:
                 job.add_validation(ValidationResult(
                     status=ValidationStatus.INVALID,
@@ -94,8 +95,25 @@ class FileUploadUseCase:
                 ))
         
         job.complete()
+        
+        # Keep the job record so its status can be looked up later
+        if self.job_repository is not None:
+            self.job_repository.save(job)
+        
         return job
     
+    def _parse_and_store(self, file_path: str, job_id: str) -> DataFrameWrapper:
+        """
+        Parse file and store the result in the repository.
+        
+        Uses the parser's whole-file ``parse`` so uploads get a single
+        dtype and NA policy; ``load`` would join streamed chunks back into
+        one frame anyway.
+        """
+        data = self.file_parser.parse(file_path)
+        self.repository.save(data, job_id)
+        return data
+    
     def _get_file_type(self, filename: str) -> FileType:
         """Determine file type from extension."""
         ext = filename.lower().split('.')[-1]
@@ -112,40 +130,26 @@ class FileUploadUseCase:
         expected_schema: List[ColumnSchema]
     ) -> ValidationResult:
         """Validate data against schema."""
-        import pandas as pd
-        
-        df = data.data
-        errors = []
-        
-        for col_schema in expected_schema:
-            if col_schema.name not in df.columns:
-                if col_schema.required:
-                    errors.append(f"Missing required column: {col_schema.name}")
-                continue
-            
-            # Type validation
-            actual_type = df[col_schema.name].dtype
-            # ... type checking logic
-        
-        if errors:
-            return ValidationResult(
-                status=ValidationStatus.INVALID,
-                message="Schema validation failed",
-                details={'errors': errors}
-            )
-        
-        return ValidationResult(
-            status=ValidationStatus.VALID,
-            message="Schema validation passed"
-        )
+        validator = schema_validator_factory(expected_schema)
+        return validator(data.data)
 
 
 class DataTransformationUseCase:
     """Use case for transforming data."""
     
-    def __init__(self, repository, transformers: List[Any]):
+    def __init__(self, repository, transformers: Union[List[Any], Dict[str, Any]]):
         self.repository = repository
-        self.transformers = {t.get_name(): t for t in transformers}
+        if isinstance(transformers, dict):
+            self.transformers = dict(transformers)
+        else:
+            self.transformers = {t.get_name(): t for t in transformers}
+    
+    def _resolve_chain(self, transformations: List[str]) -> List[Any]:
+        """Resolve transformer names to instances, failing on unknown names."""
+        unknown = [t for t in transformations if t not in self.transformers]
+        if unknown:
+            raise ValueError(f"Unknown transformer: {', '.join(unknown)}")
+        return [self.transformers[t] for t in transformations]
     
     def execute(
         self, 
@@ -164,17 +168,16 @@ class DataTransformationUseCase:
         Returns:
             Transformed DataFrameWrapper
         """
+        # Resolve transformers before paying for the load
+        chain = self._resolve_chain(transformations)
+        
         # Load data
         data = self.repository.load(job_id)
         if not data:
             raise JobNotFoundError(job_id)
         
         # Apply transformations in order
-        for transform_name in transformations:
-            if transform_name not in self.transformers:
-                raise ValueError(f"Unknown transformer: {transform_name}")
-            
-            transformer = self.transformers[transform_name]
+        for transformer in chain:
             data = transformer.transform(data)
         
         # Save transformed data
@@ -194,20 +197,20 @@ class DataExportUseCase:
         self, 
         job_id: str, 
         format: str,
-        output_path: str,
+        output_path: Union[str, BinaryIO],
         sheet_name: Optional[str] = None
-    ) -> str:
+    ) -> Union[str, BinaryIO]:
         """
         Export data to specified format.
         
         Args:
             job_id: Job ID
             format: Export format (excel, csv, json)
-            output_path: Output file path
+            output_path: Output file path, or a binary stream to write into
             sheet_name: Optional sheet name for Excel
             
         Returns:
-            Path to exported file
+            The output path or stream that was written
         """
         # Load data
         data = self.repository.load(job_id)
@@ -222,6 +225,31 @@ class DataExportUseCase:
         exporter.export(data, output_path, sheet_name)
         
         return output_path
+    
+    def stream(self, job_id: str, format: str) -> Optional[Iterator[bytes]]:
+        """
+        Export data as a lazy stream of encoded chunks.
+        
+        Args:
+            job_id: Job ID
+            format: Export format (excel, csv, json)
+            
+        Returns:
+            Iterator of bytes, or None if the exporter cannot stream
+        """
+        data = self.repository.load(job_id)
+        if not data:
+            raise JobNotFoundError(job_id)
+        
+        if format not in self.exporters:
+            raise ValueError(f"Unknown export format: {format}")
+        
+        exporter = self.exporters[format]
+        if not hasattr(exporter, 'iter_chunks'):
+            return None
+        # The stream is read after this returns; give it its own wrapper so a
+        # later transform swapping the frame can't change it mid-export
+        return exporter.iter_chunks(copy.copy(data))
 
 
 class JobManagementUseCase:
@@ -253,6 +281,6 @@ class JobManagementUseCase:
             'filename': job.file_metadata.filename,
             'status': 'complete' if job.is_complete else 'processing',
             'validations': job.get_validation_summary(),
-            'results_count': len(job.results),
+            'results_count': job.results_count,
             'transformations': job.transformations
         }
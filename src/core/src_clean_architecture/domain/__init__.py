@@ -3,12 +3,21 @@ Domain Layer: Core business entities and rules.
 This layer has NO external dependencies.
 """
 
+import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Protocol
+from typing import Dict, Iterator, List, Optional, Any, Protocol
 from datetime import datetime
 from enum import Enum
 
 
+def _datetime_from_ns(ns: Optional[int]) -> Optional[datetime]:
+    """Build a local datetime from a time.time_ns() stamp."""
+    if ns is None:
+        return None
+    seconds, remainder = divmod(ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=remainder // 1000)
+
+
 class FileType(Enum):
     """Supported file types."""
     XLSX = "xlsx"
@@ -23,7 +32,7 @@ class ValidationStatus(Enum):
     WARNING = "warning"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColumnSchema:
     """Schema definition for a column."""
     name: str
@@ -42,17 +51,22 @@ class ColumnSchema:
             raise ValueError(f"Invalid dtype: {self.dtype}. Must be one of {valid_dtypes}")
 
 
-@dataclass
+@dataclass(slots=True)
 class FileMetadata:
     """Metadata about an uploaded file."""
     filename: str
     file_type: FileType
     size_bytes: int
-    upload_timestamp: datetime = field(default_factory=datetime.now)
     sheet_names: List[str] = field(default_factory=list)
     row_count: int = 0
     column_count: int = 0
     checksum: Optional[str] = None
+    _upload_ns: int = field(default_factory=time.time_ns, init=False, repr=False)
+    
+    @property
+    def upload_timestamp(self) -> datetime:
+        """Return upload time as a datetime."""
+        return _datetime_from_ns(self._upload_ns)
     
     @property
     def size_mb(self) -> float:
@@ -60,35 +74,66 @@ class FileMetadata:
         return self.size_bytes / (1024 * 1024)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of data validation."""
     status: ValidationStatus
     message: str
     details: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.now)
+    _timestamp_ns: int = field(default_factory=time.time_ns, init=False, repr=False)
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Return validation time as a datetime."""
+        return _datetime_from_ns(self._timestamp_ns)
     
     @property
     def is_valid(self) -> bool:
         return self.status == ValidationStatus.VALID
 
 
-@dataclass
+@dataclass(slots=True)
 class DataFrameWrapper:
     """Wrapper for pandas DataFrame with metadata."""
     data: Any  # pd.DataFrame - use Any to avoid pandas dependency in domain
     metadata: FileMetadata
     schema: Optional[List[ColumnSchema]] = None
     validation_results: List[ValidationResult] = field(default_factory=list)
-    
-    def get_summary(self) -> Dict[str, Any]:
-        """Get summary statistics."""
+    _memory_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Estimated bytes per object-dtype cell (pointer + small string) for shallow summaries
+    OBJECT_CELL_ESTIMATE = 64
+    
+    def _memory_bytes(self, deep: bool) -> int:
+        """Memory footprint of the frame, cached until the frame is replaced or reshaped."""
+        key = (id(self.data), self.data.shape, deep)
+        if self._memory_cache is not None and self._memory_cache[0] == key:
+            return self._memory_cache[1]
+        
+        if deep:
+            total = int(self.data.memory_usage(deep=True).sum())
+        else:
+            # Avoid walking every Python object; estimate object columns instead
+            object_columns = len(self.data.select_dtypes('object').columns)
+            total = int(self.data.memory_usage(deep=False).sum())
+            total += object_columns * len(self.data) * self.OBJECT_CELL_ESTIMATE
+        
+        self._memory_cache = (key, total)
+        return total
+    
+    def get_summary(self, deep: bool = False) -> Dict[str, Any]:
+        """
+        Get summary statistics.
+        
+        Args:
+            deep: Measure exact object-column memory instead of estimating it
+        """
         return {
             'filename': self.metadata.filename,
             'rows': self.metadata.row_count,
             'columns': self.metadata.column_count,
             'sheets': len(self.metadata.sheet_names),
-            'memory_mb': round(self.data.memory_usage(deep=True).sum() / (1024**2), 2)
+            'memory_mb': round(self._memory_bytes(deep) / (1024**2), 2)
         }
 
 
@@ -103,6 +148,15 @@ class FileParserProtocol(Protocol):
         """Parse file into DataFrameWrapper."""
         ...
     
+    def parse_chunks(
+        self,
+        file_path: str,
+        sheet_name: Optional[str] = None,
+        chunksize: int = 100_000
+    ) -> Iterator[DataFrameWrapper]:
+        """Parse file into a stream of DataFrameWrapper row chunks."""
+        ...
+    
     def get_sheet_names(self, file_path: str) -> List[str]:
         """Get available sheet names."""
         ...
@@ -143,6 +197,10 @@ class RepositoryProtocol(Protocol):
         """Save data to repository."""
         ...
     
+    def append(self, data: DataFrameWrapper, key: str) -> bool:
+        """Append a chunk of rows to the data stored under key."""
+        ...
+    
     def load(self, key: str) -> Optional[DataFrameWrapper]:
         """Load data from repository."""
         ...
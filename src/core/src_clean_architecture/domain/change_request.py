@@ -2,11 +2,16 @@
 Domain entities for AI Review & Approve workflow.
 """
 
+import sys
+import time
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Tuple, Union
 from datetime import datetime
 from enum import Enum
 
+from . import _datetime_from_ns
+
 
 class ChangeStatus(Enum):
     """Status of a change request."""
@@ -28,9 +33,24 @@ class ChangeType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+# Timestamp slots written when a ChangeRequest enters each status
+_STAMP_FIELDS: Dict[ChangeStatus, Tuple[str, ...]] = {
+    ChangeStatus.PENDING: ('_updated_ns',),
+    ChangeStatus.SUGGESTED: ('_updated_ns',),
+    ChangeStatus.APPROVED: ('_approved_ns', '_updated_ns'),
+    ChangeStatus.REJECTED: ('_updated_ns',),
+    ChangeStatus.APPLIED: ('_applied_ns', '_updated_ns'),
+    ChangeStatus.FAILED: ('_updated_ns',),
+}
+
+# Category order for CellChangeBatch.change_type_codes (one signed byte per row)
+_CHANGE_TYPE_CATEGORIES: Tuple[ChangeType, ...] = tuple(ChangeType)
+_CHANGE_TYPE_CODES: Dict[ChangeType, int] = {ct: i for i, ct in enumerate(_CHANGE_TYPE_CATEGORIES)}
+
+
+@dataclass(frozen=True, slots=True)
 class CellChange:
-    """Represents a single cell change."""
+    """Represents a single cell change. Immutable once created."""
     sheet_id: str
     cell_id: str
     old_value: Any
@@ -39,13 +59,95 @@ class CellChange:
     description: str
     formula: Optional[str] = None
     
+    def __post_init__(self):
+        # Descriptions repeat heavily across AI suggestions; share one copy
+        if isinstance(self.description, str):
+            object.__setattr__(self, 'description', sys.intern(self.description))
+    
     @property
     def is_formula_change(self) -> bool:
         """Check if this is a formula change."""
         return self.formula is not None or str(self.new_value).startswith('=')
 
 
-@dataclass
+@dataclass(slots=True)
+class CellChangeBatch:
+    """Column-oriented view of many cell changes for bulk apply/preview."""
+    sheet_ids: Tuple[str, ...]
+    cell_ids: Tuple[str, ...]
+    old_values: Tuple[Any, ...]
+    new_values: Tuple[Any, ...]
+    change_type_codes: array  # array('b') of _CHANGE_TYPE_CATEGORIES indices
+    descriptions: Tuple[str, ...]
+    formulas: Tuple[Optional[str], ...]
+    _formula_mask: Optional[Tuple[bool, ...]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @classmethod
+    def from_list(cls, changes: List[CellChange]) -> 'CellChangeBatch':
+        """Build a batch from a list of CellChange records."""
+        if not changes:
+            return cls((), (), (), (), array('b'), (), ())
+        codes = _CHANGE_TYPE_CODES
+        sheet_ids, cell_ids, old_values, new_values, type_codes, descriptions, formulas = zip(*(
+            (c.sheet_id, c.cell_id, c.old_value, c.new_value, codes[c.change_type], c.description, c.formula)
+            for c in changes
+        ))
+        return cls(
+            sheet_ids, cell_ids, old_values, new_values,
+            array('b', type_codes), descriptions, formulas
+        )
+    
+    @classmethod
+    def coerce(cls, changes: Union['CellChangeBatch', List[CellChange]]) -> 'CellChangeBatch':
+        """Return changes as a batch, converting from a list if needed."""
+        if isinstance(changes, cls):
+            return changes
+        return cls.from_list(changes)
+    
+    def __len__(self) -> int:
+        return len(self.cell_ids)
+    
+    @property
+    def change_types(self) -> Tuple[ChangeType, ...]:
+        """Per-row ChangeType members decoded from the category codes."""
+        categories = _CHANGE_TYPE_CATEGORIES
+        return tuple(categories[code] for code in self.change_type_codes)
+    
+    def change_type_at(self, index: int) -> ChangeType:
+        """Get the ChangeType of a single row."""
+        return _CHANGE_TYPE_CATEGORIES[self.change_type_codes[index]]
+    
+    def distinct_change_types(self) -> List[str]:
+        """Distinct change type values present in the batch."""
+        return [_CHANGE_TYPE_CATEGORIES[code].value for code in sorted(set(self.change_type_codes))]
+    
+    @property
+    def formula_mask(self) -> Tuple[bool, ...]:
+        """Per-row formula flag, computed once for the whole batch."""
+        if self._formula_mask is None:
+            self._formula_mask = tuple(
+                f is not None or (v if isinstance(v, str) else str(v)).startswith('=')
+                for f, v in zip(self.formulas, self.new_values)
+            )
+        return self._formula_mask
+    
+    @property
+    def formula_count(self) -> int:
+        """Number of formula changes in the batch."""
+        return sum(self.formula_mask)
+    
+    def to_list(self) -> List[CellChange]:
+        """Rebuild the row-oriented CellChange list."""
+        return [
+            CellChange(*row)
+            for row in zip(
+                self.sheet_ids, self.cell_ids, self.old_values, self.new_values,
+                self.change_types, self.descriptions, self.formulas
+            )
+        ]
+
+
+@dataclass(slots=True)
 class ChangeSuggestion:
     """AI-generated change suggestion."""
     suggestion_id: str
@@ -53,13 +155,29 @@ class ChangeSuggestion:
     reasoning: str
     changes: List[CellChange]
     confidence_score: float  # 0.0 to 1.0
-    created_at: datetime = field(default_factory=datetime.now)
+    impact: Optional[str] = field(default=None, compare=False)  # low/medium/high, set by the processor
+    _created_ns: int = field(default_factory=time.time_ns, init=False, repr=False)
+    _change_types: frozenset = field(default=frozenset(), init=False, repr=False, compare=False)
+    _cached_len: int = field(default=-1, init=False, repr=False, compare=False)
+    
+    @property
+    def created_at(self) -> datetime:
+        """Return creation time as a datetime."""
+        return _datetime_from_ns(self._created_ns)
     
     @property
     def affected_cells_count(self) -> int:
         """Get number of affected cells."""
         return len(self.changes)
     
+    @property
+    def change_types(self) -> frozenset:
+        """Distinct change type values, recomputed only when changes grow or shrink."""
+        if self._cached_len != len(self.changes):
+            self._change_types = frozenset(c.change_type.value for c in self.changes)
+            self._cached_len = len(self.changes)
+        return self._change_types
+    
     def get_summary(self) -> Dict[str, Any]:
         """Get summary of suggestion."""
         return {
@@ -68,11 +186,11 @@ class ChangeSuggestion:
             'reasoning': self.reasoning,
             'affected_cells': self.affected_cells_count,
             'confidence': f"{self.confidence_score:.0%}",
-            'change_types': list(set(c.change_type.value for c in self.changes))
+            'change_types': list(self.change_types)
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangeRequest:
     """Complete change request with approval workflow."""
     request_id: str
@@ -82,53 +200,96 @@ class ChangeRequest:
     status: ChangeStatus
     suggestions: List[ChangeSuggestion] = field(default_factory=list)
     selected_suggestion_id: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
-    approved_at: Optional[datetime] = None
-    applied_at: Optional[datetime] = None
     error_message: Optional[str] = None
     applied_changes: List[CellChange] = field(default_factory=list)
+    _created_ns: int = field(default_factory=time.time_ns, init=False, repr=False)
+    _updated_ns: int = field(default=0, init=False, repr=False)
+    _approved_ns: Optional[int] = field(default=None, init=False, repr=False)
+    _applied_ns: Optional[int] = field(default=None, init=False, repr=False)
+    _suggestion_by_id: Dict[str, ChangeSuggestion] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        self._updated_ns = self._created_ns
+        self._suggestion_by_id = {s.suggestion_id: s for s in self.suggestions}
+    
+    @property
+    def created_at(self) -> datetime:
+        return _datetime_from_ns(self._created_ns)
+    
+    @property
+    def updated_at(self) -> datetime:
+        return _datetime_from_ns(self._updated_ns)
+    
+    @property
+    def approved_at(self) -> Optional[datetime]:
+        return _datetime_from_ns(self._approved_ns)
+    
+    @property
+    def applied_at(self) -> Optional[datetime]:
+        return _datetime_from_ns(self._applied_ns)
     
     def add_suggestion(self, suggestion: ChangeSuggestion):
         """Add a suggestion to the request."""
         self.suggestions.append(suggestion)
-        self.updated_at = datetime.now()
+        self._suggestion_by_id[suggestion.suggestion_id] = suggestion
         if self.status == ChangeStatus.PENDING:
-            self.status = ChangeStatus.SUGGESTED
+            self._transition(ChangeStatus.SUGGESTED)
+        else:
+            self._updated_ns = time.time_ns()
     
-    def approve(self, suggestion_id: str):
+    def _transition(self, status: ChangeStatus, ts: Optional[int] = None):
+        """Move to a new status and stamp its timestamp fields with a single clock read."""
+        if ts is None:
+            ts = time.time_ns()
+        self.status = status
+        for name in _STAMP_FIELDS[status]:
+            setattr(self, name, ts)
+    
+    def approve(self, suggestion_id: str, ts: Optional[int] = None):
         """Approve a specific suggestion."""
         self.selected_suggestion_id = suggestion_id
-        self.status = ChangeStatus.APPROVED
-        self.approved_at = datetime.now()
-        self.updated_at = datetime.now()
+        self._transition(ChangeStatus.APPROVED, ts)
+    
+    @staticmethod
+    def bulk_approve(approvals: Iterable[Tuple['ChangeRequest', str]], ts: Optional[int] = None):
+        """Approve many (request, suggestion_id) pairs with one shared timestamp."""
+        if ts is None:
+            ts = time.time_ns()
+        for request, suggestion_id in approvals:
+            request.approve(suggestion_id, ts)
     
     def reject(self):
         """Reject all suggestions."""
-        self.status = ChangeStatus.REJECTED
-        self.updated_at = datetime.now()
+        self._transition(ChangeStatus.REJECTED)
     
     def mark_applied(self, changes: List[CellChange]):
         """Mark changes as applied."""
-        self.status = ChangeStatus.APPLIED
         self.applied_changes = changes
-        self.applied_at = datetime.now()
-        self.updated_at = datetime.now()
+        self._transition(ChangeStatus.APPLIED)
     
     def mark_failed(self, error: str):
         """Mark request as failed."""
-        self.status = ChangeStatus.FAILED
         self.error_message = error
-        self.updated_at = datetime.now()
+        self._transition(ChangeStatus.FAILED)
+    
+    def get_suggestion(self, suggestion_id: str) -> Optional[ChangeSuggestion]:
+        """Get a suggestion by ID."""
+        suggestion = self._suggestion_by_id.get(suggestion_id)
+        if suggestion is None:
+            # Fall back to a scan for suggestions appended to the list directly
+            for candidate in self.suggestions:
+                if candidate.suggestion_id == suggestion_id:
+                    self._suggestion_by_id[suggestion_id] = candidate
+                    return candidate
+        return suggestion
     
     def get_selected_suggestion(self) -> Optional[ChangeSuggestion]:
         """Get the approved/selected suggestion."""
         if not self.selected_suggestion_id:
             return None
-        for suggestion in self.suggestions:
-            if suggestion.suggestion_id == self.selected_suggestion_id:
-                return suggestion
-        return None
+        return self.get_suggestion(self.selected_suggestion_id)
     
     @property
     def is_pending(self) -> bool:
@@ -174,13 +335,16 @@ class AIChangeReviewerProtocol:
 
 
 class ChangeApplierProtocol:
-    """Protocol for applying changes to files."""
+    """Protocol for applying changes to files.
+    
+    Implementations accept either a list of CellChange or a CellChangeBatch.
+    """
     
     def apply_changes(
         self,
         file_id: str,
         sheet_id: str,
-        changes: List[CellChange]
+        changes: Union[List[CellChange], CellChangeBatch]
     ) -> bool:
         """Apply changes to file."""
         ...
@@ -189,11 +353,11 @@ class ChangeApplierProtocol:
         self,
         file_id: str,
         sheet_id: str,
-        changes: List[CellChange]
+        changes: Union[List[CellChange], CellChangeBatch]
     ) -> Dict[str, Any]:
         """Preview changes without applying."""
         ...
     
-    def can_apply(self, changes: List[CellChange]) -> bool:
+    def can_apply(self, changes: Union[List[CellChange], CellChangeBatch]) -> bool:
         """Check if changes can be applied."""
         ...
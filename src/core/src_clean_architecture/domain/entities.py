@@ -2,13 +2,35 @@
 Domain entities and exceptions.
 """
 
-from typing import List, Optional
+import sys
+from typing import Any, Dict, List, NamedTuple, Optional
 from . import FileMetadata, DataFrameWrapper, ValidationResult
 
 
+class PipelineStep(NamedTuple):
+    """A single step in a processing pipeline."""
+    name: str
+    operation: str
+    params: Dict[str, Any]
+    
+    def __getitem__(self, key):
+        # Keep step['name'] working for callers written against the old dict steps
+        if isinstance(key, str):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+
 class ProcessingJob:
     """Represents a data processing job."""
     
+    __slots__ = (
+        'job_id', 'file_metadata', 'target_sheet', 'transformations',
+        'results', 'validation_results', 'is_complete', '_passed', '_failed'
+    )
+    
     def __init__(
         self,
         job_id: str,
@@ -19,10 +41,12 @@ class ProcessingJob:
         self.job_id = job_id
         self.file_metadata = file_metadata
         self.target_sheet = target_sheet
-        self.transformations = transformations or []
+        self.transformations = [sys.intern(t) for t in transformations or []]
         self.results: List[DataFrameWrapper] = []
         self.validation_results: List[ValidationResult] = []
         self.is_complete = False
+        self._passed = 0
+        self._failed = 0
     
     def add_result(self, result: DataFrameWrapper):
         """Add processing result."""
@@ -31,35 +55,42 @@ class ProcessingJob:
     def add_validation(self, validation: ValidationResult):
         """Add validation result."""
         self.validation_results.append(validation)
+        if validation.is_valid:
+            self._passed += 1
+        else:
+            self._failed += 1
     
     def complete(self):
         """Mark job as complete."""
         self.is_complete = True
     
+    @property
+    def results_count(self) -> int:
+        """Get number of processing results."""
+        return len(self.results)
+    
     def get_validation_summary(self) -> dict:
         """Get validation summary."""
         return {
             'total_validations': len(self.validation_results),
-            'passed': sum(1 for v in self.validation_results if v.is_valid),
-            'failed': sum(1 for v in self.validation_results if not v.is_valid)
+            'passed': self._passed,
+            'failed': self._failed
         }
 
 
 class ProcessingPipeline:
     """Pipeline for chaining multiple operations."""
     
+    __slots__ = ('name', 'steps', 'results')
+    
     def __init__(self, name: str):
         self.name = name
-        self.steps: List[dict] = []
+        self.steps: List[PipelineStep] = []
         self.results: List[DataFrameWrapper] = []
     
     def add_step(self, name: str, operation: str, params: Optional[dict] = None):
         """Add a processing step."""
-        self.steps.append({
-            'name': name,
-            'operation': operation,
-            'params': params or {}
-        })
+        self.steps.append(PipelineStep(name, operation, params or {}))
         return self
     
     def get_step_count(self) -> int:
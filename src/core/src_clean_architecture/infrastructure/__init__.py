@@ -8,7 +8,9 @@ from .parsers import (
     NullValueCleaner,
     ColumnRenamer,
     TypeConverter,
+    ParallelTransformer,
     InMemoryRepository,
+    InMemoryJobRepository,
     ExcelExporter,
     CSVExporter,
     JSONExporter
@@ -33,7 +35,9 @@ __all__ = [
     'NullValueCleaner',
     'ColumnRenamer',
     'TypeConverter',
+    'ParallelTransformer',
     'InMemoryRepository',
+    'InMemoryJobRepository',
     'ExcelExporter',
     'CSVExporter',
     'JSONExporter',
@@ -3,25 +3,148 @@ Infrastructure layer for AI Review & Approve workflow.
 Implements AI change reviewer and change applier.
 """
 
-import uuid
-from typing import Dict, Any, List, Optional
-import json
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
+import asyncio
+import hashlib
+import io
+import logging
+import re
+
+# orjson is optional; fall back to the stdlib json module when it is missing
+try:
+    import orjson
+
+    _JSONDecodeError = orjson.JSONDecodeError
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    import json
+
+    _JSONDecodeError = json.JSONDecodeError
+    _loads = json.loads
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+# ijson is optional; large AI responses are streamed with it when available
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# xxhash is optional; cache keys fall back to blake2b
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
 from ..domain.change_request import (
     ChangeRequest,
     ChangeSuggestion,
     CellChange,
+    CellChangeBatch,
     ChangeType
 )
 from ..application.ai_review_use_case import ChangeRepository
+from ..application.id_generator import generate_id
+
+logger = logging.getLogger(__name__)
+
+_CELL_ID_RE = re.compile(r'^[A-Z]+[0-9]+$')
+
+# ChangeType by value; unknown types from the AI fall back to CUSTOM
+_CT_MAP = {ct.value: ct for ct in ChangeType}
+
+# Verb phrase used by explain_change for each change type
+_CT_VERBS = {
+    ChangeType.FORMULA_EDIT: "Update formula in",
+    ChangeType.DATA_CLEANUP: "Clean data in",
+    ChangeType.COLUMN_RENAME: "Rename column",
+    ChangeType.FORMATTING: "Apply formatting to",
+    ChangeType.CALCULATION: "Add calculation in",
+    ChangeType.CUSTOM: "Modify"
+}
+
+_DECODE_ERRORS = (_JSONDecodeError, ijson.JSONError) if ijson is not None else (_JSONDecodeError,)
+
+# Responses at least this large are stream-parsed with ijson
+_STREAM_THRESHOLD = 64 * 1024
+
+# Payload of the first markdown code fence; an unterminated fence runs to the end
+_FENCE_RE = re.compile(r'```(?:json)?\s*(.*?)(?:```|\Z)', re.S)
+
+# Analysis prompt; literal braces in the JSON example are doubled for str.format
+_PROMPT_TEMPLATE = """You are an Excel expert assistant. Analyze the following spreadsheet data and suggest changes based on the user's request.
+
+User Request: {user_prompt}
+
+Spreadsheet Data:
+- Sheet ID: {sheet_id}
+- Columns: {columns}
+- Sample Data (first 5 rows):
+{sample_data}
+
+Current Formulas:
+{formulas}
+
+Please suggest specific changes to make. For each change, provide:
+1. The cell ID (e.g., "A1", "B2")
+2. The current value
+3. The new value or formula
+4. A brief explanation of why this change is needed
+5. The type of change (formula_edit, data_cleanup, column_rename, formatting, calculation, or custom)
+
+Format your response as a JSON object with this structure:
+{{
+  "suggestions": [
+    {{
+      "description": "Brief description of the change",
+      "reasoning": "Why this change is needed",
+      "confidence": 0.95,
+      "changes": [
+        {{
+          "cell_id": "B5",
+          "old_value": "100",
+          "new_value": "=SUM(B1:B4)",
+          "description": "Calculate total",
+          "change_type": "formula_edit"
+        }}
+      ]
+    }}
+  ]
+}}
+
+Only suggest changes that are safe and reversible. Do not suggest destructive changes."""
+
+
+def _prompt_key(prompt: str) -> str:
+    """Hash a prompt into a response cache key."""
+    data = prompt.encode('utf-8')
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _as_str(value: Any) -> str:
+    """Convert a cell value to str, skipping the call when it already is one."""
+    return value if isinstance(value, str) else str(value)
 
 
 class AIChangeSuggestionService:
     """
     AI service for analyzing files and suggesting changes.
     This integrates with the existing AI system.
+    
+    AI responses are cached per prompt in a small LRU, so repeating an
+    identical request skips the AI call. Suggestions are re-parsed from
+    the cached response, so every request gets fresh suggestion IDs.
     """
     
+    CACHE_SIZE = 128
+    
     def __init__(self, ai_service):
         """
         Initialize with AI service.
@@ -30,6 +153,11 @@ class AIChangeSuggestionService:
             ai_service: Existing AI service from the application
         """
         self.ai_service = ai_service
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+    
+    def clear_cache(self):
+        """Drop all cached AI responses."""
+        self._cache.clear()
     
     async def generate_suggestions(
         self,
@@ -57,9 +185,17 @@ class AIChangeSuggestionService:
             sheet_id=sheet_id
         )
         
+        # The prompt is derived from user_prompt, sheet_id and file_content,
+        # so it doubles as the cache key material
+        cache_key = _prompt_key(ai_prompt)
+        
         # Call AI service
         try:
-            ai_response = await self.ai_service.process_request(ai_prompt)
+            ai_response = self._cache.get(cache_key)
+            if ai_response is not None:
+                self._cache.move_to_end(cache_key)
+            else:
+                ai_response = await self.ai_service.process_request(ai_prompt)
             
             # Parse AI response into suggestions
             suggestions = self._parse_ai_response(
@@ -68,11 +204,18 @@ class AIChangeSuggestionService:
                 request.sheet_id
             )
             
+            # Only cache responses that produced suggestions, so a bad
+            # response is retried rather than replayed
+            if suggestions:
+                self._cache[cache_key] = ai_response
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+            
             return suggestions
             
         except Exception as e:
             # Return empty list or raise based on error
-            print(f"AI analysis error: {e}")
+            logger.exception("AI analysis error: %s", e)
             return []
     
     def _build_analysis_prompt(
@@ -82,49 +225,13 @@ class AIChangeSuggestionService:
         sheet_id: str
     ) -> str:
         """Build prompt for AI analysis."""
-        prompt = f"""You are an Excel expert assistant. Analyze the following spreadsheet data and suggest changes based on the user's request.
-
-User Request: {user_prompt}
-
-Spreadsheet Data:
-- Sheet ID: {sheet_id}
-- Columns: {file_content.get('columns', [])}
-- Sample Data (first 5 rows):
-{json.dumps(file_content.get('sample_data', []), indent=2)}
-
-Current Formulas:
-{json.dumps(file_content.get('formulas', {}), indent=2)}
-
-Please suggest specific changes to make. For each change, provide:
-1. The cell ID (e.g., "A1", "B2")
-2. The current value
-3. The new value or formula
-4. A brief explanation of why this change is needed
-5. The type of change (formula_edit, data_cleanup, column_rename, formatting, calculation, or custom)
-
-Format your response as a JSON object with this structure:
-{{
-  "suggestions": [
-    {{
-      "description": "Brief description of the change",
-      "reasoning": "Why this change is needed",
-      "confidence": 0.95,
-      "changes": [
-        {{
-          "cell_id": "B5",
-          "old_value": "100",
-          "new_value": "=SUM(B1:B4)",
-          "description": "Calculate total",
-          "change_type": "formula_edit"
-        }}
-      ]
-    }}
-  ]
-}}
-
-Only suggest changes that are safe and reversible. Do not suggest destructive changes."""
-        
-        return prompt
+        return _PROMPT_TEMPLATE.format(
+            user_prompt=user_prompt,
+            sheet_id=sheet_id,
+            columns=file_content.get('columns', []),
+            sample_data=_dumps(file_content.get('sample_data', [])),
+            formulas=_dumps(file_content.get('formulas', {}))
+        )
     
     def _parse_ai_response(
         self,
@@ -134,69 +241,74 @@ Only suggest changes that are safe and reversible. Do not suggest destructive ch
     ) -> List[ChangeSuggestion]:
         """Parse AI response into ChangeSuggestion objects."""
         suggestions = []
+        append = suggestions.append
         
         try:
             # Try to parse JSON from AI response
             # Handle both direct JSON and JSON in markdown code blocks
-            response_text = ai_response
-            
-            # Extract JSON from markdown if present
-            if "```json" in response_text:
-                start = response_text.find("```json") + 7
-                end = response_text.find("```", start)
-                response_text = response_text[start:end].strip()
-            elif "```" in response_text:
-                start = response_text.find("```") + 3
-                end = response_text.find("```", start)
-                response_text = response_text[start:end].strip()
+            match = _FENCE_RE.search(ai_response)
+            response_text = match.group(1).strip() if match else ai_response.lstrip()
             
-            data = json.loads(response_text)
+            # Prose replies (refusals, apologies) can't hold the expected object
+            if not response_text.startswith('{'):
+                logger.debug("Non-JSON AI response: %s", ai_response[:500])
+                return suggestions
             
-            for sugg_data in data.get('suggestions', []):
-                changes = []
-                
-                for change_data in sugg_data.get('changes', []):
-                    cell_change = CellChange(
+            for sugg_data in self._iter_suggestion_data(response_text):
+                changes = [
+                    CellChange(
                         sheet_id=sheet_id,
                         cell_id=change_data.get('cell_id', ''),
                         old_value=change_data.get('old_value'),
                         new_value=change_data.get('new_value'),
-                        change_type=ChangeType(change_data.get('change_type', 'custom')),
+                        change_type=_CT_MAP.get(change_data.get('change_type'), ChangeType.CUSTOM),
                         description=change_data.get('description', ''),
                         formula=change_data.get('formula')
                     )
-                    changes.append(cell_change)
+                    for change_data in sugg_data.get('changes', [])
+                ]
                 
-                suggestion = ChangeSuggestion(
-                    suggestion_id=str(uuid.uuid4()),
+                append(ChangeSuggestion(
+                    suggestion_id=generate_id(),
                     description=sugg_data.get('description', ''),
                     reasoning=sugg_data.get('reasoning', ''),
                     changes=changes,
                     confidence_score=sugg_data.get('confidence', 0.8)
-                )
-                suggestions.append(suggestion)
+                ))
                 
-        except json.JSONDecodeError as e:
-            print(f"Failed to parse AI response as JSON: {e}")
-            print(f"Response: {ai_response[:500]}")
+        except _DECODE_ERRORS as e:
+            # A streaming decode can fail after some suggestions were built;
+            # never pass a truncated set off as the complete answer
+            suggestions.clear()
+            logger.warning("Failed to parse AI response as JSON: %s", e)
+            logger.debug("Response: %s", ai_response[:500])
         except Exception as e:
-            print(f"Error parsing AI response: {e}")
+            suggestions.clear()
+            logger.exception("Error parsing AI response: %s", e)
         
         return suggestions
     
+    def _iter_suggestion_data(self, response_text: str) -> Iterable[Dict[str, Any]]:
+        """
+        Iterate suggestion dicts from a JSON response.
+        
+        Large responses are streamed item by item with ijson, so suggestions
+        are built as they are decoded instead of after the whole document
+        is materialized. Small responses are cheaper to decode in one go.
+        """
+        if ijson is not None and len(response_text) >= _STREAM_THRESHOLD:
+            return ijson.items(
+                io.BytesIO(response_text.encode('utf-8')),
+                'suggestions.item',
+                use_float=True
+            )
+        data = _loads(response_text)
+        return data.get('suggestions', [])
+    
     def explain_change(self, change: CellChange) -> str:
         """Generate human-readable explanation of a change."""
-        explanations = {
-            ChangeType.FORMULA_EDIT: f"Update formula in {change.cell_id}",
-            ChangeType.DATA_CLEANUP: f"Clean data in {change.cell_id}",
-            ChangeType.COLUMN_RENAME: f"Rename column {change.cell_id}",
-            ChangeType.FORMATTING: f"Apply formatting to {change.cell_id}",
-            ChangeType.CALCULATION: f"Add calculation in {change.cell_id}",
-            ChangeType.CUSTOM: f"Modify {change.cell_id}"
-        }
-        
-        base = explanations.get(change.change_type, f"Change {change.cell_id}")
-        return f"{base}: {change.description}"
+        verb = _CT_VERBS.get(change.change_type, "Change")
+        return f"{verb} {change.cell_id}: {change.description}"
 
 
 class SpreadsheetChangeApplier:
@@ -211,19 +323,17 @@ class SpreadsheetChangeApplier:
         """
         self.spreadsheet_store = spreadsheet_store
     
-    def can_apply(self, changes: List[CellChange]) -> bool:
+    def can_apply(self, changes: Union[List[CellChange], CellChangeBatch]) -> bool:
         """Check if changes can be applied."""
+        batch = CellChangeBatch.coerce(changes)
         # Check for invalid cell IDs, circular references, etc.
-        for change in changes:
-            if not self._is_valid_cell_id(change.cell_id):
-                return False
-        return True
+        return all(self._is_valid_cell_id(cell_id) for cell_id in batch.cell_ids)
     
     def apply_changes(
         self,
         file_id: str,
         sheet_id: str,
-        changes: List[CellChange]
+        changes: Union[List[CellChange], CellChangeBatch]
     ) -> bool:
         """
         Apply changes to spreadsheet.
@@ -231,39 +341,135 @@ class SpreadsheetChangeApplier:
         Args:
             file_id: File ID
             sheet_id: Sheet ID
-            changes: List of changes to apply
+            changes: List or batch of changes to apply
             
         Returns:
             True if successful
         """
+        batch = CellChangeBatch.coerce(changes)
+        
+        # Validate up front so a bad cell ID never leaves a partial write
+        if not self.can_apply(batch):
+            return False
+        
         try:
-            for change in changes:
-                # Set the new value
-                self.spreadsheet_store.setCellValue(
-                    file_id,
-                    sheet_id,
-                    change.cell_id,
-                    str(change.new_value)
-                )
+            values = [
+                (cell_id, _as_str(new_value))
+                for cell_id, new_value in zip(batch.cell_ids, batch.new_values)
+            ]
+            if not values:
+                return True
+            
+            self._set_cell_values(file_id, sheet_id, values, undo=batch)
+            self._mark_applied(file_id)
+            return True
+            
+        except Exception as e:
+            logger.exception("Error applying changes: %s", e)
+            return False
+    
+    async def apply_changes_async(
+        self,
+        file_id: str,
+        sheet_id: str,
+        changes: Union[List[CellChange], CellChangeBatch]
+    ) -> bool:
+        """
+        Apply changes, issuing cell writes concurrently when the store is async.
+        
+        Uses setCellValueAsync with asyncio.gather if the store provides it,
+        otherwise behaves exactly like apply_changes. Keeps the same
+        guarantees as the sync path: changes are validated first, writes
+        are wrapped in beginBatch/endBatch, and if any write fails every
+        cell in the batch is restored to the value read before writing.
+        """
+        store = self.spreadsheet_store
+        set_cell_async = getattr(store, 'setCellValueAsync', None)
+        if set_cell_async is None:
+            return self.apply_changes(file_id, sheet_id, changes)
+        
+        batch = CellChangeBatch.coerce(changes)
+        
+        # Validate up front so a bad cell ID never leaves a partial write
+        if not self.can_apply(batch):
+            return False
+        
+        try:
+            if not len(batch):
+                return True
             
-            # Mark file as modified
-            self.spreadsheet_store.markFileModified(file_id, True)
+            # Snapshot current values so a failed write can be undone
+            get_cell_async = getattr(store, 'getCellValueAsync', None)
+            if get_cell_async is not None:
+                snapshot = await asyncio.gather(*(
+                    get_cell_async(file_id, sheet_id, cell_id) for cell_id in batch.cell_ids
+                ))
+            else:
+                snapshot = self._get_cell_values(file_id, sheet_id, batch.cell_ids)
             
-            # Refresh grid if available
-            if hasattr(self.spreadsheet_store, 'refreshGrid'):
-                self.spreadsheet_store.refreshGrid()
+            batching = hasattr(store, 'beginBatch') and hasattr(store, 'endBatch')
+            if batching:
+                store.beginBatch()
+            try:
+                results = await asyncio.gather(*(
+                    set_cell_async(file_id, sheet_id, cell_id, _as_str(new_value))
+                    for cell_id, new_value in zip(batch.cell_ids, batch.new_values)
+                ), return_exceptions=True)
+                
+                error = next((r for r in results if isinstance(r, BaseException)), None)
+                if error is not None:
+                    await self._restore_snapshot_async(
+                        set_cell_async, file_id, sheet_id, batch.cell_ids, snapshot
+                    )
+                    raise error
+            finally:
+                if batching:
+                    store.endBatch()
             
+            self._mark_applied(file_id)
             return True
             
         except Exception as e:
-            print(f"Error applying changes: {e}")
+            logger.exception("Error applying changes: %s", e)
             return False
     
+    async def _restore_snapshot_async(
+        self,
+        set_cell_async,
+        file_id: str,
+        sheet_id: str,
+        cell_ids: List[str],
+        snapshot: List[Any]
+    ):
+        """Best-effort restore of cells to the values read before an async apply."""
+        values = []
+        for value in snapshot:
+            if isinstance(value, dict):
+                value = value.get('value')
+            values.append(_as_str(value) if value is not None else '')
+        
+        results = await asyncio.gather(*(
+            set_cell_async(file_id, sheet_id, cell_id, value)
+            for cell_id, value in zip(cell_ids, values)
+        ), return_exceptions=True)
+        for cell_id, result in zip(cell_ids, results):
+            if isinstance(result, BaseException):
+                logger.error("Error restoring cell %s after failed apply: %s", cell_id, result)
+    
+    def _mark_applied(self, file_id: str):
+        """Mark the file modified and refresh the grid after a write batch."""
+        store = self.spreadsheet_store
+        store.markFileModified(file_id, True)
+        
+        # Refresh grid if available
+        if hasattr(store, 'refreshGrid'):
+            store.refreshGrid()
+    
     def preview_changes(
         self,
         file_id: str,
         sheet_id: str,
-        changes: List[CellChange]
+        changes: Union[List[CellChange], CellChangeBatch]
     ) -> Dict[str, Any]:
         """
         Preview changes without applying.
@@ -271,49 +477,154 @@ class SpreadsheetChangeApplier:
         Args:
             file_id: File ID
             sheet_id: Sheet ID
-            changes: List of changes
+            changes: List or batch of changes
             
         Returns:
             Preview data
         """
-        preview = {
-            'file_id': file_id,
-            'sheet_id': sheet_id,
-            'affected_cells': [],
-            'estimated_impact': 'low'
-        }
+        batch = CellChangeBatch.coerce(changes)
+        current_values = self._get_cell_values(file_id, sheet_id, batch.cell_ids)
+        return self._build_preview(file_id, sheet_id, batch, current_values)
+    
+    async def preview_changes_async(
+        self,
+        file_id: str,
+        sheet_id: str,
+        changes: Union[List[CellChange], CellChangeBatch]
+    ) -> Dict[str, Any]:
+        """
+        Preview changes, reading cells concurrently when the store is async.
         
-        formula_count = sum(1 for c in changes if c.is_formula_change)
+        Uses getCellValueAsync with asyncio.gather if the store provides it,
+        otherwise behaves exactly like preview_changes.
+        """
+        get_cell_async = getattr(self.spreadsheet_store, 'getCellValueAsync', None)
+        if get_cell_async is None:
+            return self.preview_changes(file_id, sheet_id, changes)
         
-        if formula_count > 0:
-            preview['estimated_impact'] = 'medium' if formula_count < 5 else 'high'
+        batch = CellChangeBatch.coerce(changes)
+        current_values = await asyncio.gather(*(
+            get_cell_async(file_id, sheet_id, cell_id) for cell_id in batch.cell_ids
+        ))
+        return self._build_preview(file_id, sheet_id, batch, current_values)
+    
+    def _build_preview(
+        self,
+        file_id: str,
+        sheet_id: str,
+        batch: CellChangeBatch,
+        current_values: List[Any]
+    ) -> Dict[str, Any]:
+        """
+        Assemble preview data from a batch and the current cell values.
         
-        for change in changes:
-            current_value = self.spreadsheet_store.getCellValue(
-                file_id, sheet_id, change.cell_id
-            )
+        Formula changes are counted in the same pass that builds the
+        affected cells, reusing each proposed value's string form.
+        """
+        affected_cells = []
+        append = affected_cells.append
+        formula_count = 0
+        
+        for cell_id, current_value, new_value, formula, change_type, description in zip(
+            batch.cell_ids, current_values, batch.new_values, batch.formulas,
+            batch.change_types, batch.descriptions
+        ):
+            proposed_value = _as_str(new_value)
+            if formula is not None or proposed_value.startswith('='):
+                formula_count += 1
             
-            preview['affected_cells'].append({
-                'cell_id': change.cell_id,
+            append({
+                'cell_id': cell_id,
                 'current_value': current_value.get('value', '') if current_value else '',
-                'proposed_value': str(change.new_value),
-                'change_type': change.change_type.value,
-                'description': change.description
+                'proposed_value': proposed_value,
+                'change_type': change_type.value,
+                'description': description
             })
         
+        estimated_impact = 'low'
+        if formula_count > 0:
+            estimated_impact = 'medium' if formula_count < 5 else 'high'
+        
+        preview = {
+            'file_id': file_id,
+            'sheet_id': sheet_id,
+            'affected_cells': affected_cells,
+            'estimated_impact': estimated_impact
+        }
+        
         return preview
     
+    def _get_cell_values(self, file_id: str, sheet_id: str, cell_ids: List[str]) -> List[Any]:
+        """Read cells in one store call, falling back to per-cell reads."""
+        store = self.spreadsheet_store
+        if hasattr(store, 'getCellValues'):
+            values = store.getCellValues(file_id, sheet_id, list(cell_ids))
+            return [values.get(cell_id) for cell_id in cell_ids]
+        get_cell = store.getCellValue
+        return [get_cell(file_id, sheet_id, cell_id) for cell_id in cell_ids]
+    
+    def _set_cell_values(
+        self,
+        file_id: str,
+        sheet_id: str,
+        values: List[Tuple[str, str]],
+        undo: Optional[CellChangeBatch] = None
+    ):
+        """
+        Write (cell_id, value) pairs in one store call, falling back to per-cell writes.
+        
+        Writes are wrapped in beginBatch/endBatch when the store supports it,
+        so grid refreshes and recomputes run once after the whole batch.
+        If a per-cell write fails and undo is given, the cells already
+        written are restored to undo's old values before re-raising.
+        """
+        store = self.spreadsheet_store
+        batching = hasattr(store, 'beginBatch') and hasattr(store, 'endBatch')
+        if batching:
+            store.beginBatch()
+        try:
+            if hasattr(store, 'setCellValues'):
+                store.setCellValues(file_id, sheet_id, values)
+            else:
+                set_cell = store.setCellValue
+                written = 0
+                try:
+                    for cell_id, value in values:
+                        set_cell(file_id, sheet_id, cell_id, value)
+                        written += 1
+                except Exception:
+                    if undo is not None and written:
+                        self._restore_cells(file_id, sheet_id, undo, written)
+                    raise
+        finally:
+            if batching:
+                store.endBatch()
+    
+    def _restore_cells(self, file_id: str, sheet_id: str, batch: CellChangeBatch, count: int):
+        """Best-effort restore of the first count cells of a batch to their old values."""
+        set_cell = self.spreadsheet_store.setCellValue
+        try:
+            for cell_id, old_value in zip(batch.cell_ids[:count], batch.old_values[:count]):
+                set_cell(
+                    file_id,
+                    sheet_id,
+                    cell_id,
+                    _as_str(old_value) if old_value is not None else ''
+                )
+        except Exception as e:
+            logger.exception("Error restoring cells after failed apply: %s", e)
+    
     def _is_valid_cell_id(self, cell_id: str) -> bool:
         """Check if cell ID is valid (e.g., A1, B2, AA10)."""
-        import re
-        pattern = r'^[A-Z]+[0-9]+$'
-        return bool(re.match(pattern, cell_id.upper()))
+        if _CELL_ID_RE.match(cell_id) is not None:
+            return True
+        return _CELL_ID_RE.match(cell_id.upper()) is not None
     
     def rollback_changes(
         self,
         file_id: str,
         sheet_id: str,
-        changes: List[CellChange]
+        changes: Union[List[CellChange], CellChangeBatch]
     ) -> bool:
         """
         Rollback changes by restoring old values.
@@ -321,23 +632,25 @@ class SpreadsheetChangeApplier:
         Args:
             file_id: File ID
             sheet_id: Sheet ID
-            changes: List of changes to rollback
+            changes: List or batch of changes to rollback
             
         Returns:
             True if successful
         """
+        batch = CellChangeBatch.coerce(changes)
         try:
-            for change in changes:
-                self.spreadsheet_store.setCellValue(
-                    file_id,
-                    sheet_id,
-                    change.cell_id,
-                    str(change.old_value) if change.old_value is not None else ''
-                )
+            values = [
+                (cell_id, _as_str(old_value) if old_value is not None else '')
+                for cell_id, old_value in zip(batch.cell_ids, batch.old_values)
+            ]
+            if not values:
+                return True
+            
+            self._set_cell_values(file_id, sheet_id, values)
             
             self.spreadsheet_store.refreshGrid()
             return True
             
         except Exception as e:
-            print(f"Error rolling back changes: {e}")
+            logger.exception("Error rolling back changes: %s", e)
             return False
@@ -2,12 +2,36 @@
 Enhanced AI Processing Service with better prompt engineering and output formatting.
 """
 
-import uuid
+import asyncio
 import json
+import logging
+import random
 import re
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from heapq import nlargest
+from operator import attrgetter
+
+# orjson is optional; fall back to the stdlib json module when it is missing.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers are shared.
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2, default=str)
 
 from ..domain.change_request import (
     ChangeRequest,
@@ -15,11 +39,123 @@ from ..domain.change_request import (
     CellChange,
     ChangeType
 )
+from ..application.id_generator import generate_id
+
+logger = logging.getLogger(__name__)
+
+# Maximum sample rows analyzed and sent to the AI
+MAX_SAMPLE_ROWS = 10
+
+_DATE_RES = (
+    re.compile(r'\d{4}-\d{2}-\d{2}'),
+    re.compile(r'\d{2}/\d{2}/\d{4}'),
+    re.compile(r'\d{2}-\d{2}-\d{4}')
+)
+_CURRENCY_RE = re.compile(r'^[$€£¥]?\s*[\d,]+\.?\d*\s*[$€£¥]?$')
+_CELLREF_RE = re.compile(r'[A-Z]+\d+')
+_JSON_FENCE_RE = re.compile(r'```json\n(.*?)\n```', re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
+# Word stems that trigger each fallback suggestion ("totals", "cleaning", ...)
+_SUM_RE = re.compile(r'\b(?:sum|total|add)', re.IGNORECASE)
+_CLEANUP_RE = re.compile(r'\b(?:clean|remov|delet)', re.IGNORECASE)
+
+# Transient failures worth retrying an AI call for
+_RETRYABLE_ERRORS = (TimeoutError, asyncio.TimeoutError, ConnectionError)
+
+# ChangeType by value; unknown types from the AI fall back to CUSTOM
+_CHANGE_TYPE_MAP = {ct.value: ct for ct in ChangeType}
+_DEFAULT_CHANGE_TYPE = ChangeType.CUSTOM
+
+# Functions that make a formula valid without any cell reference
+_CONSTANT_FUNCS = ('PI()', 'TODAY()', 'NOW()')
+
+
+def _could_be_date(s: str) -> bool:
+    """Cheap separator check that every _DATE_RES match must pass."""
+    return len(s) >= 10 and (s[4] == '-' or s[2] == '/' or s[2] == '-')
+
+
+# Intent keywords in priority order: the first intent with a keyword in the prompt wins
+_INTENT_KEYWORDS = (
+    ("calculation", ("calculate", "sum", "total", "average", "mean", "count", "formula")),
+    ("cleanup", ("clean", "remove", "delete", "null", "empty", "duplicate")),
+    ("formatting", ("format", "style", "color", "bold", "align")),
+    ("transformation", ("convert", "transform", "change", "rename")),
+    ("validation", ("check", "validate", "verify", "find")),
+    ("organization", ("sort", "filter", "group", "organize"))
+)
+_KEYWORD_RANK = {
+    kw: rank
+    for rank, (_, keywords) in enumerate(_INTENT_KEYWORDS)
+    for kw in keywords
+}
+# Zero-width lookahead reports every (possibly overlapping) keyword occurrence
+# in one scan; no keyword is a prefix of another, so none is shadowed
+_INTENT_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(kw) for kw in _KEYWORD_RANK) + '))'
+)
 
 
-@dataclass
+_SYSTEM_PROMPT = """You are an expert Excel/Spreadsheet AI assistant with deep knowledge of:
+- Formula creation and optimization (Excel, Google Sheets, OpenFormula)
+- Data cleaning and validation techniques
+- Spreadsheet best practices and patterns
+- Financial, statistical, and business calculations
+
+Your task is to analyze spreadsheet data and suggest intelligent changes.
+
+RULES:
+1. Always provide specific, actionable suggestions
+2. Include confidence scores (0.0-1.0) based on data certainty
+3. Explain the reasoning behind each suggestion
+4. Prioritize data safety - suggest non-destructive changes first
+5. Consider data types and column relationships
+6. Suggest formulas that are compatible with standard spreadsheet applications
+7. If suggesting formulas, ensure they reference correct cell ranges
+
+OUTPUT FORMAT:
+Respond with a JSON object containing:
+{
+    "reasoning": "Brief explanation of your analysis approach",
+    "suggestions": [
+        {
+            "id": "unique-id",
+            "title": "Short, clear title",
+            "description": "Detailed description of what will change",
+            "reasoning": "Why this change is beneficial",
+            "confidence": 0.95,
+            "impact": "low|medium|high",
+            "changes": [
+                {
+                    "cell_id": "A1",
+                    "current_value": "current",
+                    "new_value": "=FORMULA() or new value",
+                    "change_type": "formula_edit|data_cleanup|formatting|calculation",
+                    "explanation": "What this specific change does"
+                }
+            ],
+            "metadata": {
+                "affected_range": "A1:B10",
+                "formula_complexity": "simple|medium|complex",
+                "requires_confirmation": true|false
+            }
+        }
+    ],
+    "warnings": ["Any warnings about the data or suggestions"],
+    "alternatives": ["Alternative approaches considered"]
+}"""
+
+
+def _truncate(value: Any, limit: int = 100) -> str:
+    """Display form of a value, cut to limit characters; strings are not re-converted."""
+    s = value if isinstance(value, str) else str(value)
+    return s if len(s) <= limit else s[:limit]
+
+
+@dataclass(frozen=True, slots=True)
 class AnalysisContext:
-    """Context for AI analysis."""
+    """Context for AI analysis. Built once per request and only read afterwards."""
     file_name: str
     sheet_name: str
     columns: List[str]
@@ -28,6 +164,8 @@ class AnalysisContext:
     has_formulas: bool
     total_rows: int
     user_intent: str
+    # Sample values per column (the sample transposed), aligned with sample_data rows
+    columns_data: Dict[str, List[Any]] = field(default_factory=dict)
 
 
 class EnhancedAIProcessor:
@@ -35,6 +173,13 @@ class EnhancedAIProcessor:
     Enhanced AI processor with sophisticated prompt engineering and output parsing.
     """
     
+    # Maximum number of suggestions returned from one analysis
+    TOP_K = 20
+    
+    # Exponential backoff between AI retries, in seconds
+    RETRY_INITIAL_DELAY = 0.5
+    RETRY_MAX_DELAY = 8.0
+    
     def __init__(self, ai_service):
         self.ai_service = ai_service
         self.change_history: List[Dict] = []
@@ -83,7 +228,7 @@ class EnhancedAIProcessor:
             return enhanced_suggestions, reasoning
             
         except Exception as e:
-            print(f"AI analysis error: {e}")
+            logger.exception("AI analysis error: %s", e)
             # Fallback to basic suggestions
             return self._generate_fallback_suggestions(request, user_prompt), ""
     
@@ -93,136 +238,115 @@ class EnhancedAIProcessor:
         user_prompt: str
     ) -> AnalysisContext:
         """Build rich context for AI analysis."""
-        sample_data = file_content.get('sample_data', [])
+        # Truncate once here; everything downstream sees at most MAX_SAMPLE_ROWS
+        sample = file_content.get('sample_data', [])[:MAX_SAMPLE_ROWS]
         columns = file_content.get('columns', [])
+        file_name = file_content.get('file_name', 'unknown')
+        sheet_name = file_content.get('sheet_name', 'Sheet1')
+        total_rows = file_content.get('row_count', 0)
+        user_intent = self._classify_intent(user_prompt)
+        
+        # Nothing to infer or scan without sample rows
+        if not sample:
+            return AnalysisContext(
+                file_name=file_name,
+                sheet_name=sheet_name,
+                columns=columns,
+                sample_data=[],
+                data_types={},
+                has_formulas=False,
+                total_rows=total_rows,
+                user_intent=user_intent
+            )
+        
+        # Transpose once so each column is read as a contiguous list
+        columns_data = {col: [row.get(col) for row in sample] for col in columns}
         
         # Detect data types
-        data_types = {}
-        if sample_data and columns:
-            for col in columns:
-                values = [row.get(col) for row in sample_data if row.get(col) is not None]
-                data_types[col] = self._infer_column_type(values)
+        data_types = {
+            col: self._infer_column_type([v for v in col_values if v is not None])
+            for col, col_values in columns_data.items()
+        }
         
-        # Check for formulas
+        # Check for formulas (only strings can hold one)
         has_formulas = any(
-            str(v).startswith('=') 
-            for row in sample_data 
+            isinstance(v, str) and v.startswith('=')
+            for row in sample 
             for v in row.values()
         )
         
         return AnalysisContext(
-            file_name=file_content.get('file_name', 'unknown'),
-            sheet_name=file_content.get('sheet_name', 'Sheet1'),
+            file_name=file_name,
+            sheet_name=sheet_name,
             columns=columns,
-            sample_data=sample_data[:10],  # Limit sample size
+            sample_data=sample,
             data_types=data_types,
             has_formulas=has_formulas,
-            total_rows=file_content.get('row_count', 0),
-            user_intent=self._classify_intent(user_prompt)
+            total_rows=total_rows,
+            user_intent=user_intent,
+            columns_data=columns_data
         )
     
     def _infer_column_type(self, values: List[Any]) -> str:
-        """Infer column data type from sample values."""
+        """
+        Infer column data type from sample values.
+        
+        A column is numeric if over 80% of values are numbers, else date
+        if over 80% look like dates, else currency if over half look like
+        amounts, else text. The three categories are disjoint, so values
+        are scanned once and the scan stops as soon as a category is
+        decided or none can reach its threshold any more.
+        """
         if not values:
             return "unknown"
         
-        # Check for numeric
-        numeric_count = sum(1 for v in values if isinstance(v, (int, float)))
-        if numeric_count / len(values) > 0.8:
-            return "numeric"
-        
-        # Check for dates
-        date_patterns = [
-            r'\d{4}-\d{2}-\d{2}',
-            r'\d{2}/\d{2}/\d{4}',
-            r'\d{2}-\d{2}-\d{4}'
-        ]
-        date_count = sum(
-            1 for v in values 
-            if any(re.match(p, str(v)) for p in date_patterns)
-        )
-        if date_count / len(values) > 0.8:
-            return "date"
+        n = len(values)
+        numeric_count = date_count = currency_count = 0
         
-        # Check for currency
-        currency_count = sum(
-            1 for v in values 
-            if isinstance(v, str) and re.match(r'^[$€£¥]?\s*[\d,]+\.?\d*\s*[$€£¥]?$', str(v))
-        )
-        if currency_count / len(values) > 0.5:
-            return "currency"
+        for i, v in enumerate(values):
+            if isinstance(v, (int, float)) and not isinstance(v, bool):
+                numeric_count += 1
+                if numeric_count * 5 > n * 4:
+                    return "numeric"
+            else:
+                s = v if isinstance(v, str) else str(v)
+                if _could_be_date(s) and any(p.match(s) for p in _DATE_RES):
+                    date_count += 1
+                    if date_count * 5 > n * 4:
+                        return "date"
+                elif isinstance(v, str) and _CURRENCY_RE.match(v):
+                    currency_count += 1
+                    if currency_count * 2 > n:
+                        return "currency"
+            
+            remaining = n - i - 1
+            if (
+                (numeric_count + remaining) * 5 <= n * 4
+                and (date_count + remaining) * 5 <= n * 4
+                and (currency_count + remaining) * 2 <= n
+            ):
+                break
         
         return "text"
     
-    def _classify_intent(self, prompt: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _classify_intent(prompt: str) -> str:
         """Classify user intent from prompt."""
-        prompt_lower = prompt.lower()
-        
-        intent_keywords = {
-            "calculation": ["calculate", "sum", "total", "average", "mean", "count", "formula"],
-            "cleanup": ["clean", "remove", "delete", "null", "empty", "duplicate"],
-            "formatting": ["format", "style", "color", "bold", "align"],
-            "transformation": ["convert", "transform", "change", "rename"],
-            "validation": ["check", "validate", "verify", "find"],
-            "organization": ["sort", "filter", "group", "organize"]
-        }
-        
-        for intent, keywords in intent_keywords.items():
-            if any(kw in prompt_lower for kw in keywords):
-                return intent
-        
-        return "general"
+        best = None
+        for kw in _INTENT_KEYWORD_RE.findall(prompt.lower()):
+            rank = _KEYWORD_RANK[kw]
+            if best is None or rank < best:
+                best = rank
+                if rank == 0:
+                    break
+        
+        return _INTENT_KEYWORDS[best][0] if best is not None else "general"
     
-    def _create_system_prompt(self) -> str:
+    @staticmethod
+    def _create_system_prompt() -> str:
         """Create sophisticated system prompt for AI."""
-        return """You are an expert Excel/Spreadsheet AI assistant with deep knowledge of:
-- Formula creation and optimization (Excel, Google Sheets, OpenFormula)
-- Data cleaning and validation techniques
-- Spreadsheet best practices and patterns
-- Financial, statistical, and business calculations
-
-Your task is to analyze spreadsheet data and suggest intelligent changes.
-
-RULES:
-1. Always provide specific, actionable suggestions
-2. Include confidence scores (0.0-1.0) based on data certainty
-3. Explain the reasoning behind each suggestion
-4. Prioritize data safety - suggest non-destructive changes first
-5. Consider data types and column relationships
-6. Suggest formulas that are compatible with standard spreadsheet applications
-7. If suggesting formulas, ensure they reference correct cell ranges
-
-OUTPUT FORMAT:
-Respond with a JSON object containing:
-{
-    "reasoning": "Brief explanation of your analysis approach",
-    "suggestions": [
-        {
-            "id": "unique-id",
-            "title": "Short, clear title",
-            "description": "Detailed description of what will change",
-            "reasoning": "Why this change is beneficial",
-            "confidence": 0.95,
-            "impact": "low|medium|high",
-            "changes": [
-                {
-                    "cell_id": "A1",
-                    "current_value": "current",
-                    "new_value": "=FORMULA() or new value",
-                    "change_type": "formula_edit|data_cleanup|formatting|calculation",
-                    "explanation": "What this specific change does"
-                }
-            ],
-            "metadata": {
-                "affected_range": "A1:B10",
-                "formula_complexity": "simple|medium|complex",
-                "requires_confirmation": true|false
-            }
-        }
-    ],
-    "warnings": ["Any warnings about the data or suggestions"],
-    "alternatives": ["Alternative approaches considered"]
-}"""
+        return _SYSTEM_PROMPT
     
     def _create_analysis_message(
         self,
@@ -232,16 +356,17 @@ Respond with a JSON object containing:
         """Create detailed analysis message with context."""
         
         # Build column analysis
+        data_types = context.data_types
+        columns_data = context.columns_data
         column_analysis = []
+        append = column_analysis.append
         for col in context.columns:
-            col_type = context.data_types.get(col, "unknown")
-            sample_values = [
-                row.get(col) for row in context.sample_data[:3]
-                if row.get(col) is not None
-            ]
-            column_analysis.append(
-                f"  - {col} ({col_type}): {sample_values}"
-            )
+            col_values = columns_data.get(col)
+            if col_values is None:
+                col_values = [row.get(col) for row in context.sample_data[:3]]
+            sample_values = [v for v in col_values[:3] if v is not None]
+            append(f"  - {col} ({data_types.get(col, 'unknown')}): {sample_values}")
+        column_lines = "\n".join(column_analysis)
         
         message = f"""Analyze this spreadsheet and suggest intelligent changes.
 
@@ -257,10 +382,10 @@ Classified Intent: {context.user_intent}
 
 DATA STRUCTURE:
 Columns ({len(context.columns)}):
-{chr(10).join(column_analysis)}
+{column_lines}
 
 SAMPLE DATA (first {len(context.sample_data)} rows):
-{json.dumps(context.sample_data, indent=2, default=str)}
+{_dumps(context.sample_data)}
 
 ANALYSIS INSTRUCTIONS:
 1. Consider the user's intent: {context.user_intent}
@@ -280,7 +405,13 @@ Provide your analysis in the specified JSON format."""
         user_message: str,
         max_retries: int = 3
     ) -> str:
-        """Call AI service with retry logic."""
+        """
+        Call AI service with retry logic.
+        
+        Only transient errors (timeouts, connection failures) are retried,
+        with exponential backoff plus jitter so retries don't hammer the
+        endpoint in lockstep. Other errors are raised immediately.
+        """
         for attempt in range(max_retries):
             try:
                 # This would integrate with your actual AI service
@@ -292,10 +423,18 @@ Provide your analysis in the specified JSON format."""
                     max_tokens=2000
                 )
                 return response
-            except Exception as e:
+            except _RETRYABLE_ERRORS as e:
                 if attempt == max_retries - 1:
                     raise
-                print(f"AI call failed (attempt {attempt + 1}), retrying...")
+                delay = min(
+                    self.RETRY_MAX_DELAY,
+                    self.RETRY_INITIAL_DELAY * 2 ** attempt
+                ) + random.uniform(0, self.RETRY_INITIAL_DELAY)
+                logger.warning(
+                    "AI call failed (attempt %d/%d): %s; retrying in %.2fs",
+                    attempt + 1, max_retries, e, delay
+                )
+                await asyncio.sleep(delay)
     
     def _parse_structured_response(
         self,
@@ -309,18 +448,17 @@ Provide your analysis in the specified JSON format."""
         
         try:
             # Extract JSON from response
-            json_match = re.search(r'```json\n(.*?)\n```', response, re.DOTALL)
+            json_match = _JSON_FENCE_RE.search(response)
             if json_match:
-                json_str = json_match.group(1)
+                data = _loads(json_match.group(1))
             else:
-                # Try to find JSON without markdown
-                json_match = re.search(r'\{.*\}', response, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(0)
+                # Try to find JSON without markdown: decode the first complete
+                # object, ignoring any prose before or after it
+                start = response.find('{')
+                if start == -1:
+                    data = _loads(response)
                 else:
-                    json_str = response
-            
-            data = json.loads(json_str)
+                    data, _ = _JSON_DECODER.raw_decode(response, start)
             
             # Extract reasoning
             reasoning = data.get('reasoning', '')
@@ -330,14 +468,22 @@ Provide your analysis in the specified JSON format."""
                 changes = []
                 
                 for change_data in sugg_data.get('changes', []):
+                    # cell_id and new_value are required; a change missing
+                    # either is skipped rather than guessed
+                    try:
+                        cell_id = change_data['cell_id']
+                        new_value = change_data['new_value']
+                    except KeyError:
+                        continue
+                    
                     cell_change = CellChange(
                         sheet_id=sheet_id,
-                        cell_id=change_data.get('cell_id', 'A1'),
+                        cell_id=cell_id,
                         old_value=change_data.get('current_value'),
-                        new_value=change_data.get('new_value'),
-                        change_type=ChangeType(change_data.get('change_type', 'custom')),
+                        new_value=new_value,
+                        change_type=_CHANGE_TYPE_MAP.get(change_data.get('change_type', ''), _DEFAULT_CHANGE_TYPE),
                         description=change_data.get('explanation', ''),
-                        formula=change_data.get('new_value') if str(change_data.get('new_value', '')).startswith('=') else None
+                        formula=new_value if isinstance(new_value, str) and new_value.startswith('=') else None
                     )
                     changes.append(cell_change)
                 
@@ -347,7 +493,7 @@ Provide your analysis in the specified JSON format."""
                     confidence = float(confidence.replace('%', '')) / 100
                 
                 suggestion = ChangeSuggestion(
-                    suggestion_id=sugg_data.get('id', str(uuid.uuid4())),
+                    suggestion_id=sugg_data.get('id') or generate_id(),
                     description=sugg_data.get('title', sugg_data.get('description', '')),
                     reasoning=sugg_data.get('reasoning', ''),
                     changes=changes,
@@ -356,10 +502,10 @@ Provide your analysis in the specified JSON format."""
                 suggestions.append(suggestion)
             
         except json.JSONDecodeError as e:
-            print(f"Failed to parse AI response as JSON: {e}")
-            print(f"Response preview: {response[:500]}")
+            logger.warning("Failed to parse AI response as JSON: %s", e)
+            logger.debug("Response preview: %s", response[:500])
         except Exception as e:
-            print(f"Error parsing response: {e}")
+            logger.exception("Error parsing response: %s", e)
         
         return suggestions, reasoning
     
@@ -373,23 +519,21 @@ Provide your analysis in the specified JSON format."""
         enhanced = []
         
         for suggestion in suggestions:
-            # Add impact assessment
-            impact = self._calculate_impact(suggestion, context)
-            
             # Validate formulas if present
             validated_changes = self._validate_formulas(suggestion.changes)
             
             # Update suggestion
             suggestion.changes = validated_changes
             
+            # Add impact assessment for the validated changes
+            suggestion.impact = self._calculate_impact(suggestion, context)
+            
             # Add to enhanced list if it has valid changes
             if suggestion.changes:
                 enhanced.append(suggestion)
         
-        # Sort by confidence (highest first)
-        enhanced.sort(key=lambda x: x.confidence_score, reverse=True)
-        
-        return enhanced
+        # Keep the TOP_K most confident (highest first, ties in AI order)
+        return nlargest(self.TOP_K, enhanced, key=attrgetter('confidence_score'))
     
     def _calculate_impact(
         self,
@@ -412,19 +556,19 @@ Provide your analysis in the specified JSON format."""
         validated = []
         
         for change in changes:
-            if change.is_formula_change:
-                # Basic formula validation
-                formula = str(change.new_value)
-                
+            # Same test as CellChange.is_formula_change, reusing one str() conversion
+            new_value = change.new_value
+            formula = new_value if isinstance(new_value, str) else str(new_value)
+            if change.formula is not None or formula.startswith('='):
                 # Check for balanced parentheses
                 if formula.count('(') != formula.count(')'):
-                    print(f"Warning: Unbalanced parentheses in formula: {formula}")
+                    logger.warning("Unbalanced parentheses in formula: %s", formula)
                     continue
                 
                 # Check for valid cell references
-                cell_refs = re.findall(r'[A-Z]+\d+', formula)
-                if not cell_refs and not any(func in formula for func in ['PI()', 'TODAY()', 'NOW()']):
-                    print(f"Warning: No cell references in formula: {formula}")
+                has_cell_refs = _CELLREF_RE.search(formula) is not None
+                if not has_cell_refs and not any(func in formula for func in _CONSTANT_FUNCS):
+                    logger.warning("No cell references in formula: %s", formula)
             
             validated.append(change)
         
@@ -439,9 +583,9 @@ Provide your analysis in the specified JSON format."""
         suggestions = []
         
         # Simple formula detection
-        if any(word in user_prompt.lower() for word in ['sum', 'total', 'add']):
+        if _SUM_RE.search(user_prompt):
             suggestion = ChangeSuggestion(
-                suggestion_id=str(uuid.uuid4()),
+                suggestion_id=generate_id(),
                 description="Add SUM formula",
                 reasoning="Detected sum/total keyword in request",
                 changes=[
@@ -459,9 +603,9 @@ Provide your analysis in the specified JSON format."""
             suggestions.append(suggestion)
         
         # Cleanup detection
-        if any(word in user_prompt.lower() for word in ['clean', 'remove', 'delete']):
+        if _CLEANUP_RE.search(user_prompt):
             suggestion = ChangeSuggestion(
-                suggestion_id=str(uuid.uuid4()),
+                suggestion_id=generate_id(),
                 description="Remove empty rows",
                 reasoning="Detected cleanup keyword in request",
                 changes=[
@@ -491,7 +635,7 @@ Provide your analysis in the specified JSON format."""
             'description': suggestion.reasoning,
             'confidence': f"{suggestion.confidence_score:.0%}",
             'confidence_score': suggestion.confidence_score,
-            'impact': self._calculate_impact(suggestion, None),
+            'impact': suggestion.impact or self._calculate_impact(suggestion, None),
             'affected_cells': suggestion.affected_cells_count,
             'change_types': list(set(c.change_type.value for c in suggestion.changes)),
             'requires_confirmation': suggestion.confidence_score < 0.8,
@@ -499,8 +643,8 @@ Provide your analysis in the specified JSON format."""
             'changes': [
                 {
                     'cell_id': c.cell_id,
-                    'old_value': str(c.old_value)[:100] if c.old_value else None,
-                    'new_value': str(c.new_value)[:100] if c.new_value else None,
+                    'old_value': _truncate(c.old_value) if c.old_value else None,
+                    'new_value': _truncate(c.new_value) if c.new_value else None,
                     'is_formula': c.is_formula_change,
                     'change_type': c.change_type.value,
                     'description': c.description
@@ -2,13 +2,61 @@
 Enhanced output formatting and visualization for AI suggestions.
 """
 
+import html
+import io
 import json
-from typing import Dict, Any, List, Optional
+import sys
+from collections import deque
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
 from ..domain.change_request import ChangeSuggestion, CellChange, ChangeType
 
+# xlsxwriter is a write-only engine and noticeably faster than openpyxl.
+# constant_memory is left off: pandas does not write rows in order
+try:
+    import xlsxwriter  # noqa: F401
+    _EXCEL_ENGINE = 'xlsxwriter'
+    _EXCEL_ENGINE_KWARGS = {'options': {'strings_to_urls': False}}
+except ImportError:
+    _EXCEL_ENGINE = 'openpyxl'
+    _EXCEL_ENGINE_KWARGS = {}
+
+_EXCEL_COLS = (
+    'Suggestion ID', 'Suggestion Title', 'Confidence', 'Cell',
+    'Change Type', 'Old Value', 'New Value', 'Description'
+)
+
+# Confidence bucket boundaries shared by every output format
+_HIGH_CONFIDENCE = 0.8
+_MEDIUM_CONFIDENCE = 0.5
+
+# Labels repeat once per suggestion in the JSON tree; share one object each
+_HIGH = sys.intern('high')
+_MEDIUM = sys.intern('medium')
+_LOW = sys.intern('low')
+
+_HTML_CONFIDENCE_CLASS = {
+    _HIGH: 'high-confidence',
+    _MEDIUM: 'medium-confidence',
+    _LOW: 'low-confidence',
+}
+
+
+# Change-type icons used in the markdown and HTML tables
+_FORMULA_ICON = "🔢"
+_VALUE_ICON = "📝"
+
+
+def _confidence_label(score: float) -> str:
+    """Bucket a confidence score into high/medium/low."""
+    if score > _HIGH_CONFIDENCE:
+        return _HIGH
+    if score > _MEDIUM_CONFIDENCE:
+        return _MEDIUM
+    return _LOW
+
 
 @dataclass
 class FormattedOutput:
@@ -20,6 +68,27 @@ class FormattedOutput:
     action_items: List[str]
 
 
+@dataclass(frozen=True, slots=True)
+class _SuggestionStats:
+    """Counts shared by the summary, JSON, action-item and statistics outputs."""
+    total: int
+    high: int
+    medium: int
+    low: int
+    total_changes: int
+    formula_changes: int
+
+
+@dataclass(frozen=True, slots=True)
+class _PreparedSuggestion:
+    """A suggestion plus the display fields every output format reads."""
+    suggestion: ChangeSuggestion
+    confidence_pct: str
+    confidence_label: str
+    impact: str
+    preview_changes: Tuple[CellChange, ...]
+
+
 class AIOutputFormatter:
     """
     Formats AI suggestions into multiple output formats.
@@ -45,20 +114,23 @@ class AIOutputFormatter:
         Returns:
             FormattedOutput with multiple formats
         """
+        # Derive per-suggestion fields and totals once for every format
+        prepared, stats = self._prepare(suggestions)
+        
         # Generate markdown
-        markdown = self._generate_markdown(suggestions, reasoning)
+        markdown = self._generate_markdown(prepared, reasoning, stats)
         
         # Generate HTML
-        html = self._generate_html(suggestions, reasoning)
+        html = self._generate_html(prepared, reasoning)
         
         # Generate JSON
-        json_data = self._generate_json(suggestions, reasoning)
+        json_data = self._generate_json(prepared, reasoning, stats)
         
         # Generate summary
-        summary = self._generate_summary(suggestions)
+        summary = self._generate_summary(stats)
         
         # Generate action items
-        action_items = self._generate_action_items(suggestions)
+        action_items = self._generate_action_items(stats)
         
         return FormattedOutput(
             markdown=markdown,
@@ -68,195 +140,210 @@ class AIOutputFormatter:
             action_items=action_items
         )
     
+    def _prepare(
+        self,
+        suggestions: List[ChangeSuggestion]
+    ) -> Tuple[List[_PreparedSuggestion], _SuggestionStats]:
+        """Derive display fields and bucket counts in a single pass."""
+        prepared = []
+        high = medium = low = total_changes = formula_changes = 0
+        for s in suggestions:
+            label = _confidence_label(s.confidence_score)
+            if label is _HIGH:
+                high += 1
+            elif label is _MEDIUM:
+                medium += 1
+            else:
+                low += 1
+            total_changes += len(s.changes)
+            formula_changes += sum(c.is_formula_change for c in s.changes)
+            prepared.append(_PreparedSuggestion(
+                suggestion=s,
+                confidence_pct=f"{s.confidence_score:.0%}",
+                confidence_label=label,
+                impact=self._calculate_impact_level(s),
+                preview_changes=tuple(s.changes[:5])
+            ))
+        
+        return prepared, _SuggestionStats(
+            total=len(suggestions),
+            high=high,
+            medium=medium,
+            low=low,
+            total_changes=total_changes,
+            formula_changes=formula_changes
+        )
+    
     def _generate_markdown(
         self,
-        suggestions: List[ChangeSuggestion],
-        reasoning: str
+        prepared: List[_PreparedSuggestion],
+        reasoning: str,
+        stats: _SuggestionStats
     ) -> str:
         """Generate rich markdown output."""
-        lines = [self.templates['header']]
+        # One shared sink for every section; joined exactly once at the end
+        sink = [self.templates['header']]
+        append = sink.append
         
         # Overall reasoning
         if reasoning:
-            lines.append(f"### 📋 Analysis Approach\n\n{reasoning}\n\n")
-            lines.append("---\n\n")
+            append(f"### 📋 Analysis Approach\n\n{reasoning}\n\n")
+            append("---\n\n")
         
-        # Group by confidence
-        high_conf = [s for s in suggestions if s.confidence_score > 0.8]
-        med_conf = [s for s in suggestions if 0.5 < s.confidence_score <= 0.8]
-        low_conf = [s for s in suggestions if s.confidence_score <= 0.5]
+        # Group by confidence in a single partitioning pass
+        buckets = {_HIGH: [], _MEDIUM: [], _LOW: []}
+        for item in prepared:
+            buckets[item.confidence_label].append(item)
+        high_conf = buckets[_HIGH]
+        med_conf = buckets[_MEDIUM]
+        low_conf = buckets[_LOW]
         
         # High confidence suggestions
         if high_conf:
-            lines.append(self.templates['confidence_high'])
+            append(self.templates['confidence_high'])
             for i, sugg in enumerate(high_conf, 1):
-                lines.append(self._format_suggestion_markdown(sugg, i))
+                self._format_suggestion_markdown(sugg, i, sink)
         
         # Medium confidence
         if med_conf:
-            lines.append("\n" + self.templates['confidence_medium'])
+            append("\n" + self.templates['confidence_medium'])
             for i, sugg in enumerate(med_conf, 1):
-                lines.append(self._format_suggestion_markdown(sugg, i))
+                self._format_suggestion_markdown(sugg, i, sink)
         
         # Low confidence
         if low_conf:
-            lines.append("\n" + self.templates['confidence_low'])
+            append("\n" + self.templates['confidence_low'])
             for i, sugg in enumerate(low_conf, 1):
-                lines.append(self._format_suggestion_markdown(sugg, i))
+                self._format_suggestion_markdown(sugg, i, sink)
         
         # Statistics
-        lines.append("\n---\n\n")
-        lines.append(self._generate_statistics_markdown(suggestions))
+        append("\n---\n\n")
+        self._generate_statistics_markdown(stats, sink)
         
-        return "\n".join(lines)
+        return "\n".join(sink)
     
     def _format_suggestion_markdown(
         self,
-        suggestion: ChangeSuggestion,
-        index: int
-    ) -> str:
-        """Format single suggestion as markdown."""
-        lines = []
+        item: _PreparedSuggestion,
+        index: int,
+        sink: List[str]
+    ) -> None:
+        """Append a single suggestion as markdown lines to ``sink``."""
+        suggestion = item.suggestion
+        append = sink.append
         
         # Header with confidence badge
-        confidence_pct = f"{suggestion.confidence_score:.0%}"
-        lines.append(f"#### {index}. {suggestion.description} `({confidence_pct})`\n")
+        append(f"#### {index}. {suggestion.description} `({item.confidence_pct})`\n")
         
         # Reasoning
-        lines.append(f"**Why:** {suggestion.reasoning}\n")
+        append(f"**Why:** {suggestion.reasoning}\n")
         
         # Changes table
         if suggestion.changes:
-            lines.append("\n**Changes:**\n")
-            lines.append("| Cell | Type | Before | After |")
-            lines.append("|------|------|--------|-------|")
+            append("\n**Changes:**\n")
+            append("| Cell | Type | Before | After |")
+            append("|------|------|--------|-------|")
             
-            for change in suggestion.changes[:5]:  # Limit to 5 for preview
-                cell = change.cell_id
-                type_icon = "🔢" if change.is_formula_change else "📝"
-                before = str(change.old_value)[:30] if change.old_value else "(empty)"
-                after = str(change.new_value)[:30] if change.new_value else "(empty)"
-                
-                lines.append(f"| {cell} | {type_icon} | `{before}` | `{after}` |")
+            sink.extend(
+                f"| {change.cell_id} | {_FORMULA_ICON if change.is_formula_change else _VALUE_ICON} "
+                f"| `{str(change.old_value)[:30] if change.old_value else '(empty)'}` "
+                f"| `{str(change.new_value)[:30] if change.new_value else '(empty)'}` |"
+                for change in item.preview_changes
+            )
             
             if len(suggestion.changes) > 5:
-                lines.append(f"| ... | | | *+{len(suggestion.changes) - 5} more* |")
+                append(f"| ... | | | *+{len(suggestion.changes) - 5} more* |")
             
-            lines.append("")
+            append("")
         
         # Action buttons hint
-        lines.append("\n💡 *Click 'Preview' to see full details or 'Approve' to apply*\n")
-        
-        return "\n".join(lines)
+        append("\n💡 *Click 'Preview' to see full details or 'Approve' to apply*\n")
     
     def _generate_html(
         self,
-        suggestions: List[ChangeSuggestion],
+        prepared: List[_PreparedSuggestion],
         reasoning: str
     ) -> str:
         """Generate HTML output for web display."""
-        html_parts = []
-        
-        html_parts.append("<div class='ai-suggestions-container'>")
+        # Every interpolated value comes from the AI or the sheet: escape it
+        esc = html.escape
+        buf = io.StringIO()
+        w = buf.write
         
         # Header
-        html_parts.append("<h2>🤖 AI Analysis Results</h2>")
+        w("<div class='ai-suggestions-container'>\n")
+        w("<h2>🤖 AI Analysis Results</h2>\n")
         
         # Reasoning
         if reasoning:
-            html_parts.append(f"<div class='analysis-reasoning'><p>{reasoning}</p></div>")
+            w(f"<div class='analysis-reasoning'><p>{esc(reasoning)}</p></div>\n")
         
         # Suggestions
-        html_parts.append("<div class='suggestions-list'>")
+        w("<div class='suggestions-list'>\n")
         
-        for i, sugg in enumerate(suggestions, 1):
-            confidence_class = (
-                'high-confidence' if sugg.confidence_score > 0.8
-                else 'medium-confidence' if sugg.confidence_score > 0.5
-                else 'low-confidence'
-            )
-            
-            html_parts.append(f"""
-            <div class='suggestion-card {confidence_class}' data-id='{sugg.suggestion_id}'>
-                <div class='suggestion-header'>
-                    <span class='suggestion-number'>{i}</span>
-                    <h3 class='suggestion-title'>{suggestion.description}</h3>
-                    <span class='confidence-badge'>{suggestion.confidence_score:.0%}</span>
-                </div>
-                <div class='suggestion-body'>
-                    <p class='suggestion-reasoning'>{suggestion.reasoning}</p>
-                    <div class='changes-preview'>
-                        <h4>Changes ({len(suggestion.changes)} cells):</h4>
-                        <table class='changes-table'>
-                            <thead>
-                                <tr>
-                                    <th>Cell</th>
-                                    <th>Type</th>
-                                    <th>Before</th>
-                                    <th>After</th>
-                                </tr>
-                            </thead>
-                            <tbody>
-            """)
+        for i, item in enumerate(prepared, 1):
+            sugg = item.suggestion
+            confidence_class = _HTML_CONFIDENCE_CLASS[item.confidence_label]
             
-            for change in suggestion.changes[:5]:
-                change_type_icon = "🔢" if change.is_formula_change else "📝"
-                html_parts.append(f"""
-                                <tr>
-                                    <td class='cell-id'>{change.cell_id}</td>
-                                    <td class='change-type'>{change_type_icon}</td>
-                                    <td class='old-value'><code>{change.old_value or '(empty)'}</code></td>
-                                    <td class='new-value'><code>{change.new_value or '(empty)'}</code></td>
-                                </tr>
-                """)
+            w(f"<div class='suggestion-card {confidence_class}' data-id='{esc(str(sugg.suggestion_id))}'>\n")
+            w("<div class='suggestion-header'>\n")
+            w(f"<span class='suggestion-number'>{i}</span>\n")
+            w(f"<h3 class='suggestion-title'>{esc(str(sugg.description))}</h3>\n")
+            w(f"<span class='confidence-badge'>{item.confidence_pct}</span>\n")
+            w("</div>\n")
+            w("<div class='suggestion-body'>\n")
+            w(f"<p class='suggestion-reasoning'>{esc(str(sugg.reasoning))}</p>\n")
+            w("<div class='changes-preview'>\n")
+            w(f"<h4>Changes ({len(sugg.changes)} cells):</h4>\n")
+            w("<table class='changes-table'>\n")
+            w("<thead><tr><th>Cell</th><th>Type</th><th>Before</th><th>After</th></tr></thead>\n")
+            w("<tbody>\n")
             
-            html_parts.append("""
-                            </tbody>
-                        </table>
-                    </div>
-                </div>
-            </div>
-            """)
-        
-        html_parts.append("</div></div>")
-        
-        return "\n".join(html_parts)
+            # Rows go straight into the buffer; no per-table join
+            for change in item.preview_changes:
+                w(
+                    f"<tr><td class='cell-id'>{esc(str(change.cell_id))}</td>"
+                    f"<td class='change-type'>{_FORMULA_ICON if change.is_formula_change else _VALUE_ICON}</td>"
+                    f"<td class='old-value'><code>{esc(str(change.old_value or '(empty)'))}</code></td>"
+                    f"<td class='new-value'><code>{esc(str(change.new_value or '(empty)'))}</code></td></tr>"
+                )
+            if item.preview_changes:
+                w("\n")
+            w("</tbody></table></div></div></div>\n")
+        
+        w("</div></div>")
+        
+        return buf.getvalue()
     
     def _generate_json(
         self,
-        suggestions: List[ChangeSuggestion],
-        reasoning: str
+        prepared: List[_PreparedSuggestion],
+        reasoning: str,
+        stats: _SuggestionStats
     ) -> Dict[str, Any]:
         """Generate structured JSON output."""
         return {
             'analysis': {
                 'timestamp': datetime.now().isoformat(),
-                'total_suggestions': len(suggestions),
+                'total_suggestions': stats.total,
                 'reasoning': reasoning,
                 'statistics': {
-                    'high_confidence': len([s for s in suggestions if s.confidence_score > 0.8]),
-                    'medium_confidence': len([s for s in suggestions if 0.5 < s.confidence_score <= 0.8]),
-                    'low_confidence': len([s for s in suggestions if s.confidence_score <= 0.5]),
-                    'total_changes': sum(len(s.changes) for s in suggestions),
-                    'formula_changes': sum(
-                        1 for s in suggestions 
-                        for c in s.changes if c.is_formula_change
-                    )
+                    'high_confidence': stats.high,
+                    'medium_confidence': stats.medium,
+                    'low_confidence': stats.low,
+                    'total_changes': stats.total_changes,
+                    'formula_changes': stats.formula_changes
                 }
             },
             'suggestions': [
                 {
-                    'id': s.suggestion_id,
-                    'title': s.description,
-                    'description': s.reasoning,
-                    'confidence': s.confidence_score,
-                    'confidence_label': (
-                        'high' if s.confidence_score > 0.8
-                        else 'medium' if s.confidence_score > 0.5
-                        else 'low'
-                    ),
-                    'impact': self._calculate_impact_level(s),
-                    'changes_count': len(s.changes),
+                    'id': p.suggestion.suggestion_id,
+                    'title': p.suggestion.description,
+                    'description': p.suggestion.reasoning,
+                    'confidence': p.suggestion.confidence_score,
+                    'confidence_label': p.confidence_label,
+                    'impact': p.impact,
+                    'changes_count': len(p.suggestion.changes),
                     'changes': [
                         {
                             'cell_id': c.cell_id,
@@ -266,22 +353,21 @@ class AIOutputFormatter:
                             'new_value': c.new_value,
                             'description': c.description
                         }
-                        for c in s.changes
+                        for c in p.suggestion.changes
                     ]
                 }
-                for s in suggestions
+                for p in prepared
             ]
         }
     
-    def _generate_summary(self, suggestions: List[ChangeSuggestion]) -> str:
+    def _generate_summary(self, stats: _SuggestionStats) -> str:
         """Generate brief text summary."""
-        if not suggestions:
+        if not stats.total:
             return "No suggestions generated."
         
-        total_changes = sum(len(s.changes) for s in suggestions)
-        high_conf = len([s for s in suggestions if s.confidence_score > 0.8])
+        high_conf = stats.high
         
-        summary = f"AI generated {len(suggestions)} suggestions affecting {total_changes} cells. "
+        summary = f"AI generated {stats.total} suggestions affecting {stats.total_changes} cells. "
         summary += f"{high_conf} high-confidence suggestion{'s' if high_conf != 1 else ''}. "
         
         if high_conf > 0:
@@ -291,22 +377,18 @@ class AIOutputFormatter:
         
         return summary
     
-    def _generate_action_items(self, suggestions: List[ChangeSuggestion]) -> List[str]:
+    def _generate_action_items(self, stats: _SuggestionStats) -> List[str]:
         """Generate actionable items."""
         items = []
         
-        high_conf = [s for s in suggestions if s.confidence_score > 0.8]
-        med_conf = [s for s in suggestions if 0.5 < s.confidence_score <= 0.8]
-        low_conf = [s for s in suggestions if s.confidence_score <= 0.5]
+        if stats.high:
+            items.append(f"✅ Review and approve {stats.high} high-confidence suggestion(s)")
         
-        if high_conf:
-            items.append(f"✅ Review and approve {len(high_conf)} high-confidence suggestion(s)")
+        if stats.medium:
+            items.append(f"🟡 Carefully review {stats.medium} medium-confidence suggestion(s)")
         
-        if med_conf:
-            items.append(f"🟡 Carefully review {len(med_conf)} medium-confidence suggestion(s)")
-        
-        if low_conf:
-            items.append(f"🔴 Consider rejecting {len(low_conf)} low-confidence suggestion(s)")
+        if stats.low:
+            items.append(f"🔴 Consider rejecting {stats.low} low-confidence suggestion(s)")
         
         items.append("💡 Preview changes before applying")
         
@@ -314,45 +396,36 @@ class AIOutputFormatter:
     
     def _generate_statistics_markdown(
         self,
-        suggestions: List[ChangeSuggestion]
-    ) -> str:
-        """Generate statistics section."""
-        lines = ["### 📊 Statistics\n"]
-        
-        total = len(suggestions)
-        total_changes = sum(len(s.changes) for s in suggestions)
-        formula_count = sum(
-            1 for s in suggestions 
-            for c in s.changes if c.is_formula_change
-        )
+        stats: _SuggestionStats,
+        sink: List[str]
+    ) -> None:
+        """Append the statistics section lines to ``sink``."""
+        append = sink.append
+        append("### 📊 Statistics\n")
         
-        lines.append(f"- **Total Suggestions:** {total}")
-        lines.append(f"- **Total Cells Affected:** {total_changes}")
-        lines.append(f"- **Formula Changes:** {formula_count}")
+        append(f"- **Total Suggestions:** {stats.total}")
+        append(f"- **Total Cells Affected:** {stats.total_changes}")
+        append(f"- **Formula Changes:** {stats.formula_changes}")
         
         # Confidence breakdown
-        high = len([s for s in suggestions if s.confidence_score > 0.8])
-        med = len([s for s in suggestions if 0.5 < s.confidence_score <= 0.8])
-        low = len([s for s in suggestions if s.confidence_score <= 0.5])
-        
-        lines.append(f"\n**Confidence Breakdown:**")
-        lines.append(f"- 🟢 High (>80%): {high}")
-        lines.append(f"- 🟡 Medium (50-80%): {med}")
-        lines.append(f"- 🔴 Low (<50%): {low}")
-        
-        return "\n".join(lines)
+        append(f"\n**Confidence Breakdown:**")
+        append(f"- 🟢 High (>80%): {stats.high}")
+        append(f"- 🟡 Medium (50-80%): {stats.medium}")
+        append(f"- 🔴 Low (<50%): {stats.low}")
     
     def _calculate_impact_level(self, suggestion: ChangeSuggestion) -> str:
         """Calculate impact level."""
-        num_changes = len(suggestion.changes)
-        has_formulas = any(c.is_formula_change for c in suggestion.changes)
+        changes = suggestion.changes
+        num_changes = len(changes)
         
-        if num_changes > 10 or has_formulas:
-            return "high"
+        # The count alone decides large suggestions; only scan smaller ones,
+        # stopping at the first formula
+        if num_changes > 10 or any(c.is_formula_change for c in changes):
+            return _HIGH
         elif num_changes > 3:
-            return "medium"
+            return _MEDIUM
         else:
-            return "low"
+            return _LOW
     
     def format_comparison_table(
         self,
@@ -382,27 +455,93 @@ class StreamingOutputHandler:
     """
     
     def __init__(self):
-        self.buffer = []
+        self.buffer = io.StringIO()
         self.current_suggestion = None
+        # Bracket-matching state carried across tokens
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        # Values completed by earlier tokens but not yet returned
+        self._ready: deque = deque()
     
     def on_token(self, token: str):
-        """Process streaming token."""
-        self.buffer.append(token)
-        
-        # Check if we have a complete JSON object
-        content = "".join(self.buffer)
-        if self._is_complete_json(content):
-            return self._parse_partial(content)
+        """
+        Process streaming token.
         
-        return None
+        Returns the next complete JSON value, or None. When one token
+        completes several values the extras are queued and returned by the
+        following calls; use feed() to receive all of them at once.
+        """
+        self._ready.extend(self.feed(token))
+        return self._ready.popleft() if self._ready else None
     
-    def _is_complete_json(self, content: str) -> bool:
-        """Check if buffer contains complete JSON."""
-        try:
-            json.loads(content)
-            return True
-        except json.JSONDecodeError:
-            return False
+    def feed(self, token: str) -> List[Dict]:
+        """Process streaming token and return every JSON value it completes."""
+        values = []
+        while token:
+            was_open = self._depth > 0
+            start, end = self._scan(token)
+            
+            if not was_open:
+                if start < 0:
+                    break  # Text between JSON values
+                token = token[start:]
+                if end >= 0:
+                    end -= start
+            
+            if end < 0:
+                self.buffer.write(token)
+                break
+            
+            # A top-level value just closed: read and parse it exactly once
+            self.buffer.write(token[:end])
+            content = self.buffer.getvalue()
+            self.buffer = io.StringIO()
+            value = self._parse_partial(content)
+            if value is not None:
+                values.append(value)
+            token = token[end:]
+        
+        return values
+    
+    def _scan(self, token: str) -> Tuple[int, int]:
+        """
+        Advance the bracket state over ``token`` without revisiting old text.
+        
+        Returns:
+            (start, end): index where a top-level value opens and the index
+            just past where it closes, each -1 if not in this token
+        """
+        depth = self._depth
+        in_string = self._in_string
+        escape = self._escape
+        start = end = -1
+        
+        for i, ch in enumerate(token):
+            if in_string:
+                if escape:
+                    escape = False
+                elif ch == '\\':
+                    escape = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '{' or ch == '[':
+                if depth == 0:
+                    start = i
+                depth += 1
+            elif ch == '}' or ch == ']':
+                if depth:
+                    depth -= 1
+                    if depth == 0:
+                        end = i + 1
+                        break
+            elif ch == '"' and depth:
+                in_string = True
+        
+        self._depth = depth
+        self._in_string = in_string
+        self._escape = escape
+        return start, end
     
     def _parse_partial(self, content: str) -> Optional[Dict]:
         """Parse partial content."""
@@ -434,22 +573,26 @@ class OutputExporter:
         """Export suggestions to Excel for tracking."""
         import pandas as pd
         
-        data = []
+        records = []
         for sugg in suggestions:
-            for change in sugg.changes:
-                data.append({
-                    'Suggestion ID': sugg.suggestion_id,
-                    'Suggestion Title': sugg.description,
-                    'Confidence': f"{sugg.confidence_score:.0%}",
-                    'Cell': change.cell_id,
-                    'Change Type': change.change_type.value,
-                    'Old Value': change.old_value,
-                    'New Value': change.new_value,
-                    'Description': change.description
-                })
-        
-        df = pd.DataFrame(data)
-        df.to_excel(filename, index=False, sheet_name='AI Suggestions')
+            confidence = f"{sugg.confidence_score:.0%}"
+            records.extend(
+                (
+                    sugg.suggestion_id,
+                    sugg.description,
+                    confidence,
+                    change.cell_id,
+                    change.change_type.value,
+                    change.old_value,
+                    change.new_value,
+                    change.description
+                )
+                for change in sugg.changes
+            )
+        
+        df = pd.DataFrame.from_records(records, columns=_EXCEL_COLS)
+        with pd.ExcelWriter(filename, engine=_EXCEL_ENGINE, engine_kwargs=_EXCEL_ENGINE_KWARGS) as writer:
+            df.to_excel(writer, index=False, sheet_name='AI Suggestions')
     
     def to_json_file(
         self,
@@ -3,7 +3,14 @@ Infrastructure Layer: External implementations.
 This layer provides concrete implementations for domain interfaces.
 """
 
-from typing import List, Optional
+import contextlib
+import datetime
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set, Union
 import pandas as pd
 import openpyxl
 from pathlib import Path
@@ -16,7 +23,76 @@ from ..domain import (
     ValidationStatus,
     ColumnSchema
 )
-from ..domain.exceptions import ParsingError, FileValidationError
+from ..domain.entities import ProcessingJob
+from ..domain.exceptions import ParsingError, FileValidationError, StorageError
+
+# pyarrow is optional; its multithreaded CSV reader and C++ writer are much
+# faster than pandas' own CSV paths when present
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    _CSV_ENGINE = 'pyarrow'
+except ImportError:
+    pa = None
+    _CSV_ENGINE = 'c'
+
+# xlsxwriter is optional and faster than openpyxl for writing. Not
+# constant_memory: pandas writes cell by cell in column order, and that
+# mode silently drops any cell written behind the current row
+try:
+    import xlsxwriter  # noqa: F401
+    _EXCEL_ENGINE = 'xlsxwriter'
+    _EXCEL_ENGINE_KWARGS = {'options': {'strings_to_urls': False}}
+except ImportError:
+    _EXCEL_ENGINE = 'openpyxl'
+    _EXCEL_ENGINE_KWARGS = {}
+
+# orjson is optional; JSONExporter streams rows with it when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _open_output(output: Union[str, BinaryIO]):
+    """Open a path for buffered binary writing, or pass an open stream through."""
+    if isinstance(output, (str, os.PathLike)):
+        return open(output, 'wb', buffering=1 << 20)
+    return contextlib.nullcontext(output)
+
+
+def _normalize_header(header) -> List[str]:
+    """Name blank and repeated header cells the way pd.read_excel does."""
+    names = []
+    seen: Dict[str, int] = {}
+    for index, value in enumerate(header):
+        name = f"Unnamed: {index}" if value is None else str(value)
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        if count:
+            name = f"{name}.{count}"
+        names.append(name)
+    return names
+
+
+def _json_default(value):
+    """
+    Serialize values orjson passes through, the way ``DataFrame.to_json`` does.
+    
+    Datetimes and dates become epoch milliseconds (UTC) and timedeltas
+    milliseconds, pandas' default ``date_format='epoch'``, so JSON exports
+    read the same whether or not orjson is installed.
+    """
+    if value is pd.NaT:
+        return None
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return pd.Timestamp(value).value // 1_000_000
+    if isinstance(value, datetime.timedelta):
+        return pd.Timedelta(value).value // 1_000_000
+    isoformat = getattr(value, 'isoformat', None)
+    if isoformat is not None:
+        return isoformat()
+    return str(value)
 
 
 class PandasExcelParser:
@@ -32,7 +108,8 @@ class PandasExcelParser:
     def parse(
         self, 
         file_path: str, 
-        sheet_name: Optional[str] = None
+        sheet_name: Optional[str] = None,
+        stat_result: Optional[os.stat_result] = None
     ) -> DataFrameWrapper:
         """
         Parse Excel/CSV file into DataFrame.
@@ -40,32 +117,30 @@ class PandasExcelParser:
         Args:
             file_path: Path to file
             sheet_name: Sheet name (for Excel files)
+            stat_result: Result of an earlier stat of file_path, to skip re-statting
             
         Returns:
             DataFrameWrapper with data and metadata
         """
         try:
             path = Path(file_path)
+            suffix = path.suffix.lower()
             
-            if path.suffix.lower() == '.csv':
-                df = pd.read_csv(file_path)
+            if suffix == '.csv':
+                df = pd.read_csv(file_path, engine=_CSV_ENGINE)
                 sheet_names = ['Sheet1']
             else:
-                # Excel file
-                if sheet_name:
-                    df = pd.read_excel(file_path, sheet_name=sheet_name, engine='openpyxl')
-                else:
-                    df = pd.read_excel(file_path, engine='openpyxl')
-                
-                # Get sheet names
-                xl = pd.ExcelFile(file_path)
-                sheet_names = xl.sheet_names
+                # Open the workbook once for both the sheet names and the rows;
+                # pandas handles blank/duplicate headers and trailing empty rows
+                with pd.ExcelFile(file_path) as xl:
+                    sheet_names = xl.sheet_names
+                    df = xl.parse(sheet_name or 0)
             
             # Create metadata
             metadata = FileMetadata(
                 filename=path.name,
                 file_type=FileType(path.suffix.lower().replace('.', '')),
-                size_bytes=path.stat().st_size,
+                size_bytes=(stat_result or path.stat()).st_size,
                 sheet_names=sheet_names,
                 row_count=len(df),
                 column_count=len(df.columns)
@@ -83,6 +158,105 @@ class PandasExcelParser:
                 original_error=e
             )
     
+    def parse_chunks(
+        self,
+        file_path: str,
+        sheet_name: Optional[str] = None,
+        chunksize: int = 100_000,
+        stat_result: Optional[os.stat_result] = None
+    ) -> Iterator[DataFrameWrapper]:
+        """
+        Parse Excel/CSV file as a stream of row chunks.
+        
+        CSV files are read with pandas' chunked reader and .xlsx files are
+        streamed row by row with openpyxl in read-only mode, so only one
+        chunk is held by the parser at a time. Legacy .xls files are not
+        supported by openpyxl and are parsed in a single chunk.
+        
+        Args:
+            file_path: Path to file
+            sheet_name: Sheet name (for Excel files)
+            chunksize: Maximum rows per chunk
+            stat_result: Result of an earlier stat of file_path, to skip re-statting
+            
+        Yields:
+            DataFrameWrapper per chunk
+        """
+        path = Path(file_path)
+        suffix = path.suffix.lower()
+        
+        if suffix == '.xls':
+            yield self.parse(file_path, sheet_name, stat_result)
+            return
+        
+        try:
+            # Every chunk reports the same file size; stat once, not per chunk
+            size_bytes = (stat_result or path.stat()).st_size
+            
+            if suffix == '.csv':
+                yielded = False
+                for df in pd.read_csv(file_path, chunksize=chunksize):
+                    yielded = True
+                    yield self._wrap_chunk(df, path, size_bytes, ['Sheet1'])
+                if not yielded:
+                    yield self._wrap_chunk(pd.read_csv(file_path), path, size_bytes, ['Sheet1'])
+                return
+            
+            wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                sheet_names = wb.sheetnames
+                ws = wb[sheet_name] if sheet_name else wb[sheet_names[0]]
+                rows = ws.iter_rows(values_only=True)
+                header = _normalize_header(next(rows, ()))
+                batch = []
+                blank_run = []
+                yielded = False
+                for row in rows:
+                    # Formatted but empty rows are only kept if data follows
+                    # them, matching pd.read_excel's trailing-row trimming
+                    if all(value is None for value in row):
+                        blank_run.append(row)
+                        continue
+                    if blank_run:
+                        batch.extend(blank_run)
+                        blank_run = []
+                    batch.append(row)
+                    if len(batch) >= chunksize:
+                        yielded = True
+                        yield self._wrap_chunk(pd.DataFrame(batch, columns=header), path, size_bytes, sheet_names)
+                        batch = []
+                if batch or not yielded:
+                    yield self._wrap_chunk(pd.DataFrame(batch, columns=header), path, size_bytes, sheet_names)
+            finally:
+                wb.close()
+                
+        except ParsingError:
+            raise
+        except Exception as e:
+            raise ParsingError(
+                message=f"Failed to parse file: {str(e)}",
+                file_path=file_path,
+                original_error=e
+            )
+    
+    def _wrap_chunk(
+        self,
+        df: pd.DataFrame,
+        path: Path,
+        size_bytes: int,
+        sheet_names: List[str]
+    ) -> DataFrameWrapper:
+        """Wrap a parsed chunk with file metadata."""
+        metadata = FileMetadata(
+            filename=path.name,
+            file_type=FileType(path.suffix.lower().replace('.', '')),
+            size_bytes=size_bytes,
+            sheet_names=sheet_names,
+            row_count=len(df),
+            column_count=len(df.columns)
+        )
+        return DataFrameWrapper(data=df, metadata=metadata)
+    
     def get_sheet_names(self, file_path: str) -> List[str]:
         """Get available sheet names."""
         try:
@@ -119,8 +293,10 @@ class FileValidator:
         errors = []
         warnings = []
         
-        # Check if file exists
-        if not path.exists():
+        # Check if file exists; the one stat also serves the size check
+        try:
+            st = path.stat()
+        except OSError:
             return ValidationResult(
                 status=ValidationStatus.INVALID,
                 message="File does not exist",
@@ -133,7 +309,7 @@ class FileValidator:
             errors.append(f"Invalid file extension: {ext}")
         
         # Check file size
-        size_mb = path.stat().st_size / (1024 * 1024)
+        size_mb = st.st_size / (1024 * 1024)
         if size_mb > self.MAX_FILE_SIZE_MB:
             errors.append(f"File too large: {size_mb:.2f}MB (max {self.MAX_FILE_SIZE_MB}MB)")
         
@@ -141,8 +317,15 @@ class FileValidator:
         try:
             if ext == '.csv':
                 pd.read_csv(file_path, nrows=1)
-            else:
+            elif ext == '.xls':
                 pd.read_excel(file_path, nrows=1)
+            else:
+                # Read one row straight from the sheet; no DataFrame needed
+                wb = openpyxl.load_workbook(file_path, read_only=True)
+                try:
+                    next(wb.worksheets[0].iter_rows(max_row=1, values_only=True), None)
+                finally:
+                    wb.close()
         except Exception as e:
             errors.append(f"File appears to be corrupted: {str(e)}")
         
@@ -190,7 +373,8 @@ class NullValueCleaner:
     
     def transform(self, data: DataFrameWrapper) -> DataFrameWrapper:
         """Apply transformation."""
-        df = data.data.copy()
+        # dropna/fillna/interpolate already return a new frame; no upfront copy
+        df = data.data
         
         if self.strategy == 'drop':
             df = df.dropna()
@@ -226,7 +410,7 @@ class ColumnRenamer:
     
     def transform(self, data: DataFrameWrapper) -> DataFrameWrapper:
         """Apply transformation."""
-        df = data.data.rename(columns=self.column_map)
+        df = data.data.rename(columns=self.column_map, copy=False)
         data.data = df
         return data
 
@@ -251,95 +435,459 @@ class TypeConverter:
     
     def transform(self, data: DataFrameWrapper) -> DataFrameWrapper:
         """Apply transformation."""
-        df = data.data.copy()
+        df = data.data
+        columns = df.columns
+        casts = {
+            column: dtype for column, dtype in self.type_map.items()
+            if column in columns and dtype != 'datetime'
+        }
+        pending = [
+            (column, dtype) for column, dtype in self.type_map.items()
+            if column in columns and dtype == 'datetime'
+        ]
         
-        for column, dtype in self.type_map.items():
-            if column in df.columns:
-                try:
-                    if dtype == 'datetime':
-                        df[column] = pd.to_datetime(df[column])
-                    elif dtype == 'category':
-                        df[column] = df[column].astype('category')
-                    else:
-                        df[column] = df[column].astype(dtype)
-                except Exception as e:
-                    print(f"Warning: Could not convert {column} to {dtype}: {e}")
+        # One bulk astype builds the new frame in a single dispatch; if any
+        # column refuses, redo them one by one so each failure is reported
+        if casts:
+            try:
+                df = df.astype(casts)
+            except Exception:
+                pending = [
+                    (column, dtype) for column, dtype in self.type_map.items()
+                    if column in columns
+                ]
+        
+        # Never write into the caller's frame
+        if pending and df is data.data:
+            df = df.copy()
+        
+        for column, dtype in pending:
+            try:
+                if dtype == 'datetime':
+                    df[column] = pd.to_datetime(df[column])
+                elif dtype == 'category':
+                    df[column] = df[column].astype('category')
+                else:
+                    df[column] = df[column].astype(dtype)
+            except Exception as e:
+                print(f"Warning: Could not convert {column} to {dtype}: {e}")
         
         data.data = df
         return data
 
 
+def _pack_frame(df: pd.DataFrame):
+    """
+    Encode a frame as an Arrow table for the trip to another process.
+    
+    Pickling object columns writes one opcode per Python object; an Arrow
+    table pickles as a few contiguous buffers. Frames that would not come
+    back identical (non-string labels, mixed-type object columns) and any
+    frame when pyarrow is missing are passed through to plain pickling.
+    """
+    if pa is None or not all(isinstance(c, str) for c in df.columns):
+        return df
+    for column in df.columns[df.dtypes == object]:
+        if pd.api.types.infer_dtype(df[column], skipna=True) not in ('string', 'empty'):
+            return df
+    try:
+        return pa.Table.from_pandas(df)
+    except (pa.ArrowException, ValueError):
+        return df
+
+
+def _unpack_frame(payload) -> pd.DataFrame:
+    """Inverse of _pack_frame; releases Arrow buffers as columns convert."""
+    if pa is not None and isinstance(payload, pa.Table):
+        return payload.to_pandas(split_blocks=True, self_destruct=True)
+    return payload
+
+
+def _transform_rows(transformer, payload, metadata: FileMetadata):
+    """Run a transformer over one row range inside a worker process."""
+    df = _unpack_frame(payload)
+    return _pack_frame(transformer.transform(DataFrameWrapper(data=df, metadata=metadata)).data)
+
+
+class ParallelTransformer:
+    """
+    Transformer wrapper that fans large frames out to a process pool.
+    
+    The frame is split into ``2 * max_workers`` row ranges, each range is
+    transformed in a worker process and the results are concatenated in
+    order. Only wrap transformers whose output rows depend on their own
+    input row alone (dropna, fillna, ...); interpolation or anything that
+    looks across rows would give different results at range boundaries.
+    Frames under ``min_rows`` rows are transformed in-process.
+    """
+    
+    def __init__(
+        self,
+        transformer,
+        max_workers: Optional[int] = None,
+        min_rows: int = 100_000
+    ):
+        self.transformer = transformer
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_rows = min_rows
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+    
+    def get_name(self) -> str:
+        return self.transformer.get_name()
+    
+    def get_description(self) -> str:
+        return self.transformer.get_description()
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the pool on first use; spawn avoids forking a threaded server."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+    
+    def transform(self, data: DataFrameWrapper) -> DataFrameWrapper:
+        """Apply transformation."""
+        df = data.data
+        if len(df) < self.min_rows or self.max_workers < 2:
+            return self.transformer.transform(data)
+        
+        n_chunks = self.max_workers * 2
+        step = -(-len(df) // n_chunks)
+        chunks = [_pack_frame(df.iloc[start:start + step]) for start in range(0, len(df), step)]
+        
+        executor = self._get_executor()
+        results = executor.map(
+            _transform_rows,
+            [self.transformer] * len(chunks),
+            chunks,
+            [data.metadata] * len(chunks)
+        )
+        df = pd.concat([_unpack_frame(result) for result in results], copy=False)
+        
+        data.data = df
+        data.metadata.row_count = len(df)
+        data.metadata.column_count = len(df.columns)
+        return data
+    
+    def close(self) -> None:
+        """Shut down the worker processes, if any were started."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
 class InMemoryRepository:
-    """In-memory storage repository."""
+    """
+    In-memory storage repository.
+    
+    Entries are kept in least-recently-used order and the oldest are
+    evicted once more than ``max_entries`` frames are stored or their
+    combined shallow size exceeds ``max_bytes``. The most recent entry is
+    never evicted, even if it alone is over the byte budget.
+    
+    The API calls it from many worker threads at once, so every public
+    method holds one lock for its whole read-modify-write. A key that is
+    evicted while chunks are still being appended to it is remembered,
+    and the next append raises StorageError instead of silently starting
+    a truncated frame from that chunk.
+    """
     
-    def __init__(self):
-        self._storage: dict = {}
+    def __init__(self, max_entries: int = 32, max_bytes: int = 2 << 30):
+        self._storage: "OrderedDict[str, DataFrameWrapper]" = OrderedDict()
+        self._pending_chunks: Dict[str, List[pd.DataFrame]] = {}
+        # Keys built by append and not yet loaded, and those evicted meanwhile
+        self._appending: Set[str] = set()
+        self._evicted_appends: Set[str] = set()
+        self._sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._evicted_bytes = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _frame_bytes(df: pd.DataFrame) -> int:
+        """Shallow frame size; object columns count pointers, not the objects."""
+        return int(df.memory_usage(deep=False).sum())
+    
+    def _set_size(self, key: str, size: int):
+        self._total_bytes += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+    
+    def _drop_size(self, key: str) -> int:
+        size = self._sizes.pop(key, 0)
+        self._total_bytes -= size
+        return size
     
     def save(self, data: DataFrameWrapper, key: str) -> bool:
         """Save data to repository."""
-        self._storage[key] = data
-        return True
+        with self._lock:
+            self._pending_chunks.pop(key, None)
+            self._appending.discard(key)
+            self._evicted_appends.discard(key)
+            self._storage[key] = data
+            self._storage.move_to_end(key)
+            self._set_size(key, self._frame_bytes(data.data))
+            self._evict()
+            return True
+    
+    def append(self, data: DataFrameWrapper, key: str) -> bool:
+        """
+        Append a chunk of rows to the data stored under key.
+        
+        Chunks are buffered and concatenated once on the next load, so
+        appending N chunks costs a single concat instead of N.
+        """
+        with self._lock:
+            existing = self._storage.get(key)
+            if existing is None:
+                if key in self._evicted_appends:
+                    self._evicted_appends.discard(key)
+                    raise StorageError(
+                        f"Entry {key} was evicted while chunks were still being appended"
+                    )
+                self._appending.add(key)
+                self._storage[key] = data
+                self._set_size(key, self._frame_bytes(data.data))
+                self._evict()
+                return True
+            
+            self._storage.move_to_end(key)
+            self._pending_chunks.setdefault(key, []).append(data.data)
+            existing.metadata.row_count += len(data.data)
+            self._set_size(key, self._sizes.get(key, 0) + self._frame_bytes(data.data))
+            self._evict()
+            return True
     
     def load(self, key: str) -> Optional[DataFrameWrapper]:
         """Load data from repository."""
-        return self._storage.get(key)
+        with self._lock:
+            # Loading marks the end of an append sequence
+            self._appending.discard(key)
+            self._evicted_appends.discard(key)
+            data = self._storage.get(key)
+            if data is None:
+                self._misses += 1
+                return None
+            
+            self._hits += 1
+            self._storage.move_to_end(key)
+            pending = self._pending_chunks.pop(key, None)
+            if pending:
+                data.data = pd.concat([data.data, *pending], ignore_index=True)
+                data.metadata.column_count = len(data.data.columns)
+                self._set_size(key, self._frame_bytes(data.data))
+            return data
     
     def delete(self, key: str) -> bool:
         """Delete data from repository."""
-        if key in self._storage:
-            del self._storage[key]
-            return True
-        return False
+        with self._lock:
+            self._pending_chunks.pop(key, None)
+            self._appending.discard(key)
+            self._evicted_appends.discard(key)
+            if key in self._storage:
+                del self._storage[key]
+                self._drop_size(key)
+                return True
+            return False
     
     def list_keys(self) -> List[str]:
         """List all stored keys."""
-        return list(self._storage.keys())
+        with self._lock:
+            return list(self._storage.keys())
     
     def clear(self):
         """Clear all data."""
-        self._storage.clear()
+        with self._lock:
+            self._storage.clear()
+            self._pending_chunks.clear()
+            self._appending.clear()
+            self._evicted_appends.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+    
+    def metrics(self) -> Dict[str, int]:
+        """Occupancy, hit and eviction counters."""
+        with self._lock:
+            return {
+                'entries': len(self._storage),
+                'max_entries': self._max_entries,
+                'bytes': self._total_bytes,
+                'max_bytes': self._max_bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'evicted_bytes': self._evicted_bytes
+            }
+    
+    def _evict(self):
+        """Drop least-recently-used entries beyond max_entries or max_bytes."""
+        while len(self._storage) > 1 and (
+            len(self._storage) > self._max_entries
+            or self._total_bytes > self._max_bytes
+        ):
+            key, _ = self._storage.popitem(last=False)
+            self._pending_chunks.pop(key, None)
+            if key in self._appending:
+                self._appending.discard(key)
+                self._evicted_appends.add(key)
+            self._evictions += 1
+            self._evicted_bytes += self._drop_size(key)
+
+
+class InMemoryJobRepository:
+    """
+    In-memory store for ProcessingJob records.
+    
+    Jobs are kept in least-recently-used order and the oldest are evicted
+    once more than ``max_entries`` are stored. A job references its parsed
+    results, so the default matches InMemoryRepository's entry limit.
+    """
+    
+    def __init__(self, max_entries: int = 32):
+        self._jobs: "OrderedDict[str, ProcessingJob]" = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+    
+    def save(self, job: ProcessingJob) -> bool:
+        """Save a job."""
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._jobs.move_to_end(job.job_id)
+            while len(self._jobs) > self._max_entries:
+                self._jobs.popitem(last=False)
+            return True
+    
+    def load(self, job_id: str) -> Optional[ProcessingJob]:
+        """Load a job by ID."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._jobs.move_to_end(job_id)
+            return job
+    
+    def delete(self, job_id: str) -> bool:
+        """Delete a job."""
+        with self._lock:
+            return self._jobs.pop(job_id, None) is not None
+    
+    def list_all(self) -> List[ProcessingJob]:
+        """List all stored jobs."""
+        with self._lock:
+            return list(self._jobs.values())
 
 
 class ExcelExporter:
-    """Export data to Excel format."""
+    """Export data to Excel format (to a path or a binary stream)."""
     
     def export(
         self, 
         data: DataFrameWrapper, 
-        output_path: str,
+        output_path: Union[str, BinaryIO],
         sheet_name: Optional[str] = None
     ):
         """Export to Excel."""
         df = data.data
         sheet = sheet_name or 'Sheet1'
         
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+        with pd.ExcelWriter(output_path, engine=_EXCEL_ENGINE, engine_kwargs=_EXCEL_ENGINE_KWARGS) as writer:
             df.to_excel(writer, sheet_name=sheet, index=False)
 
 
 class CSVExporter:
-    """Export data to CSV format."""
+    """Export data to CSV format (to a path or a binary stream)."""
     
     def export(
         self, 
         data: DataFrameWrapper, 
-        output_path: str,
+        output_path: Union[str, BinaryIO],
         sheet_name: Optional[str] = None
     ):
-        """Export to CSV."""
+        """Export to CSV, writing exactly the bytes iter_chunks streams."""
+        with _open_output(output_path) as out:
+            for piece in self.iter_chunks(data):
+                out.write(piece)
+    
+    def iter_chunks(self, data: DataFrameWrapper, chunksize: int = 10_000) -> Iterator[bytes]:
+        """
+        Yield the CSV document as encoded pieces of at most chunksize rows.
+        
+        The writer is chosen once per frame: pyarrow's when the whole frame
+        converts to Arrow, pandas' otherwise. Every piece of a document is
+        therefore formatted the same way, whichever route exports it.
+        """
         df = data.data
-        df.to_csv(output_path, index=False)
+        table = None
+        if pa is not None:
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+            except (pa.ArrowException, ValueError):
+                # Mixed-type object columns have no Arrow type and duplicate
+                # column names are refused; let pandas write those
+                table = None
+        
+        if table is None:
+            for start in range(0, max(len(df), 1), chunksize):
+                part = df.iloc[start:start + chunksize]
+                yield part.to_csv(index=False, header=start == 0).encode()
+            return
+        
+        for start in range(0, max(table.num_rows, 1), chunksize):
+            sink = pa.BufferOutputStream()
+            pa_csv.write_csv(
+                table.slice(start, chunksize),
+                sink,
+                write_options=pa_csv.WriteOptions(include_header=start == 0, batch_size=65536)
+            )
+            yield sink.getvalue().to_pybytes()
 
 
 class JSONExporter:
-    """Export data to JSON format."""
+    """Export data to JSON format (to a path or a binary stream)."""
     
     def export(
         self, 
         data: DataFrameWrapper, 
-        output_path: str,
+        output_path: Union[str, BinaryIO],
         sheet_name: Optional[str] = None
     ):
         """Export to JSON."""
+        with _open_output(output_path) as f:
+            write = f.write
+            for chunk in self.iter_chunks(data):
+                write(chunk)
+    
+    def iter_chunks(self, data: DataFrameWrapper, chunksize: int = 10_000) -> Iterator[bytes]:
+        """Yield the JSON array as encoded pieces of at most chunksize records."""
         df = data.data
-        df.to_json(output_path, orient='records', indent=2)
+        columns = [str(c) for c in df.columns]
+        yield b'['
+        sep = b'\n'
+        for start in range(0, len(df), chunksize):
+            yield sep + self._encode_records(df.iloc[start:start + chunksize], columns)
+            sep = b',\n'
+        yield b'\n]'
+    
+    def _encode_records(self, df: pd.DataFrame, columns: List[str]) -> bytes:
+        """Encode rows as comma-separated JSON objects, without the brackets."""
+        if orjson is None:
+            return df.to_json(orient='records', indent=2)[1:-1].strip().encode()
+        
+        dumps = orjson.dumps
+        # Datetimes go through _json_default as epoch ms, like to_json above
+        option = (
+            orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        return b',\n'.join(
+            dumps(dict(zip(columns, row)), default=_json_default, option=option)
+            for row in df.itertuples(index=False, name=None)
+        )
@@ -3,30 +3,56 @@ Interface Layer: FastAPI REST API.
 This layer handles HTTP requests and responses.
 """
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks
+from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    ORJSONResponse,
+    Response,
+    StreamingResponse
+)
+from pydantic import BaseModel, TypeAdapter
+from starlette.background import BackgroundTask
+from starlette.concurrency import iterate_in_threadpool
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Final, Literal, Tuple
+from urllib.parse import quote
+import io
+import json
 import tempfile
 import os
 import shutil
 
+import anyio
+import anyio.to_thread
+
+# orjson is optional; JSON endpoints fall back to the stdlib encoder without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import from clean architecture
-from ..domain import ColumnSchema, ValidationStatus
+from ..domain import ColumnSchema, ValidationStatus, DataTransformerProtocol
 from ..application import (
     FileUploadUseCase,
     DataTransformationUseCase,
     DataExportUseCase,
-    JobManagementUseCase
+    JobManagementUseCase,
+    generate_id
 )
 from ..infrastructure import (
     PandasExcelParser,
     FileValidator,
     InMemoryRepository,
+    InMemoryJobRepository,
     NullValueCleaner,
     ColumnRenamer,
     TypeConverter,
+    ParallelTransformer,
     ExcelExporter,
     CSVExporter,
     JSONExporter
@@ -57,9 +83,28 @@ class TransformResponse(BaseModel):
     columns: int
 
 
+class TransformBatchItem(BaseModel):
+    job_id: str
+    status: Literal['success', 'error', 'skipped']
+    transformations_applied: List[str]
+    rows: Optional[int] = None
+    columns: Optional[int] = None
+    error: Optional[str] = None
+
+
+# Batch responses are a bare list, so they serialize through an adapter
+TRANSFORM_BATCH_ADAPTER = TypeAdapter(List[TransformBatchItem])
+
+
+ExportFormat = Literal['excel', 'csv', 'json']
+
+# File extension appended to each export format's download name
+EXPORT_EXTENSIONS: Final[Dict[str, str]] = {'excel': '.xlsx', 'csv': '.csv', 'json': '.json'}
+
+
 class ExportRequest(BaseModel):
     job_id: str
-    format: str  # 'excel', 'csv', 'json'
+    format: ExportFormat
     filename: Optional[str] = None
 
 
@@ -71,50 +116,278 @@ class JobSummary(BaseModel):
     results_count: int
 
 
+# Uploads are copied to disk in fixed-size pieces, never read whole
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Upload bodies beyond the validator's file limit, plus slack for the
+# multipart framing, are refused before they are spooled
+MAX_UPLOAD_BYTES = FileValidator.MAX_FILE_SIZE_MB * 1024 * 1024 + UPLOAD_CHUNK_SIZE
+
+# Browser origins allowed to call the API: Streamlit and the Vite dev server
+CORS_ORIGINS = [
+    "http://localhost:8501",
+    "http://127.0.0.1:8501",
+    "http://localhost:5173",
+    "http://127.0.0.1:5173",
+]
+
+# Worker threads for the blocking pandas use cases
+THREADPOOL_SIZE = 32
+
+# One scratch directory per process; each export file is unlinked once sent
+EXPORT_SCRATCH_DIR = Path(tempfile.gettempdir()) / "smt_exports"
+
+# Exports up to this size are sent straight from memory, never touching disk
+SMALL_EXPORT_BYTES = 256 * 1024
+
+# Idle job event streams send a comment line this often to stay open
+JOB_EVENTS_HEARTBEAT = 15.0
+
+
+class ExportFileResponse(FileResponse):
+    """FileResponse that moves large exports in 1 MiB reads instead of 64 KiB."""
+    chunk_size = 1 << 20
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Refuse oversized upload bodies with 413 before they reach disk.
+    
+    A declared Content-Length over the limit is rejected without reading
+    the body; bodies without one (chunked) are counted as they are
+    received and cut off once the running total passes the limit.
+    """
+    
+    def __init__(self, app, path: str, max_bytes: int):
+        self.app = app
+        self.path = path
+        self.max_bytes = max_bytes
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] != self.path:
+            await self.app(scope, receive, send)
+            return
+        
+        for name, value in scope["headers"]:
+            if name != b"content-length":
+                continue
+            try:
+                declared = int(value)
+            except ValueError:
+                declared = -1
+            if declared < 0:
+                response = JSONResponse({"detail": "Invalid Content-Length"}, status_code=400)
+            elif declared > self.max_bytes:
+                response = JSONResponse(
+                    {"detail": f"Upload exceeds {self.max_bytes} bytes"},
+                    status_code=413
+                )
+            else:
+                continue
+            await response(scope, receive, send)
+            return
+        
+        received = 0
+        
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"Upload exceeds {self.max_bytes} bytes"
+                    )
+            return message
+        
+        await self.app(scope, limited_receive, send)
+
+
+def _json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model in pydantic-core and return it as-is.
+    
+    FastAPI passes Response objects through untouched, so the model is
+    validated once on construction instead of again against response_model,
+    which is kept on the route only for the OpenAPI schema.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _attachment_headers(filename: str) -> Dict[str, str]:
+    """Content-Disposition header for a download, encoded like FileResponse."""
+    quoted = quote(filename)
+    if quoted != filename:
+        return {"Content-Disposition": f"attachment; filename*=utf-8''{quoted}"}
+    return {"Content-Disposition": f'attachment; filename="{filename}"'}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Prepare the worker before it serves requests and release it on shutdown."""
+    # Size the worker pool the blocking use cases are offloaded to
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    EXPORT_SCRATCH_DIR.mkdir(exist_ok=True)
+    
+    # Build dependencies now so the first request doesn't pay for them
+    for factory in (
+        get_upload_use_case,
+        get_transform_use_case,
+        get_export_use_case,
+        get_job_use_case
+    ):
+        factory()
+    
+    try:
+        yield
+    finally:
+        for transformer in get_transformers():
+            if hasattr(transformer, 'close'):
+                transformer.close()
+        for factory in (
+            get_repository,
+            get_job_repository,
+            get_transformers,
+            get_transformer_list,
+            get_upload_use_case,
+            get_transform_use_case,
+            get_export_use_case,
+            get_job_use_case
+        ):
+            factory.cache_clear()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Smart Macro Tool API",
     description="Clean Architecture Excel Processing API",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse
+)
+
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    path="/api/upload",
+    max_bytes=MAX_UPLOAD_BYTES
 )
 
 # CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Initialize dependencies (in production, use dependency injection)
-repository = InMemoryRepository()
-file_parser = PandasExcelParser()
-file_validator = FileValidator()
-
-# Transformers registry
-transformers = [
-    NullValueCleaner(strategy='drop'),
-    NullValueCleaner(strategy='fill', fill_value=0),
-    ColumnRenamer({}),
-    TypeConverter({})
-]
 
-# Exporters registry
-exporters = {
-    'excel': ExcelExporter(),
-    'csv': CSVExporter(),
-    'json': JSONExporter()
-}
+# Dependencies are built once per worker process, by lifespan or on first
+# use, and injected with Depends; tests can swap them via dependency_overrides
+@lru_cache(maxsize=1)
+def get_repository() -> InMemoryRepository:
+    """Data store shared by every use case in this process."""
+    return InMemoryRepository()
+
 
-# Initialize use cases
-upload_use_case = FileUploadUseCase(file_validator, file_parser, repository)
-transform_use_case = DataTransformationUseCase(repository, transformers)
-export_use_case = DataExportUseCase(repository, exporters)
+@lru_cache(maxsize=1)
+def get_job_repository() -> InMemoryJobRepository:
+    """Job records filled by uploads and read for status summaries."""
+    return InMemoryJobRepository()
+
+
+@lru_cache(maxsize=1)
+def get_transformers() -> List[DataTransformerProtocol]:
+    """Transformers registry."""
+    # Row-local cleaners fan large frames out to worker processes
+    return [
+        ParallelTransformer(NullValueCleaner(strategy='drop')),
+        ParallelTransformer(NullValueCleaner(strategy='fill', fill_value=0)),
+        ColumnRenamer({}),
+        TypeConverter({})
+    ]
+
+
+@lru_cache(maxsize=1)
+def get_transformer_list() -> Tuple[Dict[str, str], ...]:
+    """Name and description of each registered transformer, built once."""
+    return tuple(
+        {"name": t.get_name(), "description": t.get_description()}
+        for t in get_transformers()
+    )
+
+
+@lru_cache(maxsize=1)
+def get_upload_use_case() -> FileUploadUseCase:
+    return FileUploadUseCase(
+        FileValidator(), PandasExcelParser(), get_repository(), get_job_repository()
+    )
+
+
+@lru_cache(maxsize=1)
+def get_transform_use_case() -> DataTransformationUseCase:
+    return DataTransformationUseCase(get_repository(), get_transformers())
+
+
+@lru_cache(maxsize=1)
+def get_export_use_case() -> DataExportUseCase:
+    exporters = {
+        'excel': ExcelExporter(),
+        'csv': CSVExporter(),
+        'json': JSONExporter()
+    }
+    return DataExportUseCase(get_repository(), exporters)
+
+
+@lru_cache(maxsize=1)
+def get_job_use_case() -> JobManagementUseCase:
+    return JobManagementUseCase(get_job_repository())
+
+
+# One pending event per watched job, set and replaced whenever it changes;
+# dropped once the last stream watching the job closes
+_job_events: Dict[str, anyio.Event] = {}
+_job_watchers: Dict[str, int] = {}
+
+# Job summary statuses after which an event stream has nothing left to send
+TERMINAL_JOB_STATUSES: Final = frozenset({'complete', 'failed'})
+
+
+def _notify_job(job_id: str) -> None:
+    """Wake every event stream watching this job."""
+    event = _job_events.pop(job_id, None)
+    if event is not None:
+        event.set()
+
+
+# Transformers swap a job's frame in place on its shared wrapper, so
+# transforms and exports of one job take turns; dropped once unused
+_job_locks: Dict[str, anyio.Lock] = {}
+_job_lock_users: Dict[str, int] = {}
+
+
+@asynccontextmanager
+async def _job_lock(job_id: str):
+    """Hold the job's lock for the duration of the block."""
+    lock = _job_locks.setdefault(job_id, anyio.Lock())
+    _job_lock_users[job_id] = _job_lock_users.get(job_id, 0) + 1
+    try:
+        async with lock:
+            yield
+    finally:
+        remaining = _job_lock_users.pop(job_id) - 1
+        if remaining:
+            _job_lock_users[job_id] = remaining
+        else:
+            _job_locks.pop(job_id, None)
 
 
 @app.post("/api/upload", response_model=UploadResponse)
-async def upload_file(file: UploadFile = File(...)):
+async def upload_file(
+    file: UploadFile = File(...),
+    upload_use_case: FileUploadUseCase = Depends(get_upload_use_case)
+):
     """
     Upload and validate an Excel/CSV file.
     
@@ -125,35 +398,43 @@ async def upload_file(file: UploadFile = File(...)):
     try:
         # Save uploaded file temporarily
         temp_dir = tempfile.mkdtemp()
-        temp_path = os.path.join(temp_dir, file.filename)
-        
-        with open(temp_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
-        # Execute use case
-        job = upload_use_case.execute(temp_path, file.filename)
-        
-        # Cleanup temp file
-        shutil.rmtree(temp_dir)
+        try:
+            temp_path = os.path.join(temp_dir, os.path.basename(file.filename))
+            
+            # Stream to disk chunk by chunk without blocking the event loop
+            async with await anyio.open_file(temp_path, "wb") as buffer:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    await buffer.write(chunk)
+            
+            # Execute use case off the event loop
+            job = await anyio.to_thread.run_sync(
+                upload_use_case.execute, temp_path, file.filename
+            )
+        finally:
+            # Cleanup temp file
+            shutil.rmtree(temp_dir, ignore_errors=True)
         
         # Get result
         first_validation = job.validation_results[0] if job.validation_results else None
         
-        return UploadResponse(
+        return _json_response(UploadResponse(
             job_id=job.job_id,
             filename=job.file_metadata.filename,
             status="valid" if first_validation and first_validation.is_valid else "invalid",
             message=first_validation.message if first_validation else "No validation performed",
             rows=job.file_metadata.row_count,
             columns=job.file_metadata.column_count
-        )
+        ))
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/transform", response_model=TransformResponse)
-async def transform_data(request: TransformRequest):
+async def transform_data(
+    request: TransformRequest,
+    transform_use_case: DataTransformationUseCase = Depends(get_transform_use_case)
+):
     """
     Apply transformations to uploaded data.
     
@@ -167,19 +448,22 @@ async def transform_data(request: TransformRequest):
     - `type_converter`: Convert column types
     """
     try:
-        result = transform_use_case.execute(
-            request.job_id,
-            request.transformations,
-            request.params
-        )
+        async with _job_lock(request.job_id):
+            result = await anyio.to_thread.run_sync(
+                transform_use_case.execute,
+                request.job_id,
+                request.transformations,
+                request.params
+            )
+        _notify_job(request.job_id)
         
-        return TransformResponse(
+        return _json_response(TransformResponse(
             job_id=request.job_id,
             status="success",
             transformations_applied=request.transformations,
             rows=result.metadata.row_count,
             columns=result.metadata.column_count
-        )
+        ))
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -187,8 +471,84 @@ async def transform_data(request: TransformRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/transform/batch", response_model=List[TransformBatchItem])
+async def transform_batch(
+    batch: List[TransformRequest],
+    transform_use_case: DataTransformationUseCase = Depends(get_transform_use_case)
+):
+    """
+    Apply several transform requests in one call.
+    
+    Requests for different jobs run concurrently on worker threads;
+    requests for the same job run one after another in the order given.
+    
+    The batch is not atomic: every request that succeeds stays applied
+    even if others fail. Each gets its own result, in request order, with
+    status `success`, `error` (with the message), or `skipped` when an
+    earlier request for the same job failed.
+    """
+    # Group by job so transforms on one job never race each other
+    by_job: Dict[str, List[int]] = {}
+    for index, item in enumerate(batch):
+        by_job.setdefault(item.job_id, []).append(index)
+    
+    results: List[Any] = [None] * len(batch)
+    
+    async def run_job(job_id: str, indices: List[int]) -> None:
+        async with _job_lock(job_id):
+            for index in indices:
+                item = batch[index]
+                try:
+                    results[index] = await anyio.to_thread.run_sync(
+                        transform_use_case.execute,
+                        item.job_id,
+                        item.transformations,
+                        item.params
+                    )
+                except Exception as e:
+                    results[index] = e
+                    break
+        _notify_job(job_id)
+    
+    async with anyio.create_task_group() as tg:
+        for job_id, indices in by_job.items():
+            tg.start_soon(run_job, job_id, indices)
+    
+    responses = []
+    for item, result in zip(batch, results):
+        if isinstance(result, Exception):
+            responses.append(TransformBatchItem(
+                job_id=item.job_id,
+                status="error",
+                transformations_applied=[],
+                error=str(result)
+            ))
+        elif result is None:
+            responses.append(TransformBatchItem(
+                job_id=item.job_id,
+                status="skipped",
+                transformations_applied=[],
+                error="An earlier request for this job failed"
+            ))
+        else:
+            responses.append(TransformBatchItem(
+                job_id=item.job_id,
+                status="success",
+                transformations_applied=item.transformations,
+                rows=result.metadata.row_count,
+                columns=result.metadata.column_count
+            ))
+    return Response(
+        content=TRANSFORM_BATCH_ADAPTER.dump_json(responses),
+        media_type="application/json"
+    )
+
+
 @app.post("/api/export")
-async def export_data(request: ExportRequest):
+async def export_data(
+    request: ExportRequest,
+    export_use_case: DataExportUseCase = Depends(get_export_use_case)
+):
     """
     Export processed data to file.
     
@@ -197,23 +557,54 @@ async def export_data(request: ExportRequest):
     - **filename**: Optional custom filename
     """
     try:
-        # Create temp output path
-        temp_dir = tempfile.mkdtemp()
         filename = request.filename or f"export_{request.job_id}"
         
         # Set extension
-        ext_map = {'excel': '.xlsx', 'csv': '.csv', 'json': '.json'}
-        ext = ext_map.get(request.format, '.xlsx')
-        output_path = os.path.join(temp_dir, f"{filename}{ext}")
+        ext = EXPORT_EXTENSIONS[request.format]
+        
+        download_name = f"{filename}{ext}"
+        
+        # CSV/JSON stream out chunk by chunk; each chunk is serialized on a
+        # worker thread so the event loop only forwards bytes
+        async with _job_lock(request.job_id):
+            chunks = await anyio.to_thread.run_sync(
+                export_use_case.stream, request.job_id, request.format
+            )
+            if chunks is not None:
+                return StreamingResponse(
+                    iterate_in_threadpool(chunks),
+                    media_type='application/octet-stream',
+                    headers=_attachment_headers(download_name)
+                )
+            
+            # Execute export into memory, off the event loop
+            buffer = io.BytesIO()
+            await anyio.to_thread.run_sync(
+                export_use_case.execute, request.job_id, request.format, buffer
+            )
         
-        # Execute export
-        export_use_case.execute(request.job_id, request.format, output_path)
+        # Small exports go out inline with no disk round-trip
+        if buffer.tell() <= SMALL_EXPORT_BYTES:
+            return Response(
+                content=buffer.getvalue(),
+                media_type='application/octet-stream',
+                headers=_attachment_headers(download_name)
+            )
         
-        # Return file
-        return FileResponse(
+        # Larger ones spill to a unique scratch file served from disk
+        output_path = EXPORT_SCRATCH_DIR / f"{generate_id()}{ext}"
+        try:
+            await anyio.to_thread.run_sync(output_path.write_bytes, buffer.getbuffer())
+        except Exception:
+            output_path.unlink(missing_ok=True)
+            raise
+        
+        # Return file, deleting it after the response has been sent
+        return ExportFileResponse(
             output_path,
             media_type='application/octet-stream',
-            filename=f"{filename}{ext}"
+            filename=download_name,
+            background=BackgroundTask(os.unlink, output_path)
         )
         
     except ValueError as e:
@@ -223,33 +614,91 @@ async def export_data(request: ExportRequest):
 
 
 @app.get("/api/jobs/{job_id}", response_model=JobSummary)
-async def get_job_status(job_id: str):
+async def get_job_status(
+    job_id: str,
+    job_use_case: JobManagementUseCase = Depends(get_job_use_case)
+):
     """Get job status and summary."""
     try:
-        summary = JobManagementUseCase(repository).get_job_summary(job_id)
-        return JobSummary(**summary)
+        summary = job_use_case.get_job_summary(job_id)
+        return _json_response(JobSummary(**summary))
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
 
 
+@app.get("/api/jobs/{job_id}/events")
+async def job_events(
+    job_id: str,
+    job_use_case: JobManagementUseCase = Depends(get_job_use_case)
+):
+    """
+    Stream job status as server-sent events.
+    
+    Sends the current summary immediately, then again each time the job
+    changes, so clients don't need to poll `/api/jobs/{job_id}`. The
+    stream ends once the job reaches a terminal status or disappears.
+    """
+    if job_use_case.get_job(job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    
+    async def events():
+        _job_watchers[job_id] = _job_watchers.get(job_id, 0) + 1
+        try:
+            while True:
+                # Register before reading so a change in between isn't missed
+                event = _job_events.setdefault(job_id, anyio.Event())
+                try:
+                    summary = job_use_case.get_job_summary(job_id)
+                except Exception:
+                    return
+                yield f"data: {json.dumps(summary, default=str)}\n\n"
+                
+                if summary.get('status') in TERMINAL_JOB_STATUSES:
+                    return
+                
+                while not event.is_set():
+                    with anyio.move_on_after(JOB_EVENTS_HEARTBEAT):
+                        await event.wait()
+                    if not event.is_set():
+                        yield ": keep-alive\n\n"
+        finally:
+            # Last watcher out drops the job's event so none are left behind
+            remaining = _job_watchers.pop(job_id) - 1
+            if remaining:
+                _job_watchers[job_id] = remaining
+            else:
+                _job_events.pop(job_id, None)
+    
+    return StreamingResponse(
+        events(),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache'}
+    )
+
+
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "version": "2.0.0"}
 
 
+@app.get("/api/metrics")
+async def metrics(repository: InMemoryRepository = Depends(get_repository)):
+    """Job store occupancy and eviction counters."""
+    return {"repository": repository.metrics()}
+
+
 @app.get("/api/transformers")
-async def list_transformers():
+async def list_transformers(
+    transformer_list: Tuple[Dict[str, str], ...] = Depends(get_transformer_list)
+):
     """List available transformers."""
-    return [
-        {
-            "name": t.get_name(),
-            "description": t.get_description()
-        }
-        for t in transformers
-    ]
+    return transformer_list
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # "auto" picks uvloop and httptools from uvicorn[standard] wherever they
+    # are available (uvloop has no Windows build). Keep a single worker:
+    # jobs live in this process's InMemoryRepository.
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="auto")
@@ -5,10 +5,17 @@ This provides a web UI without needing a separate React build.
 
 import streamlit as st
 import pandas as pd
-import requests
-from typing import Optional
+import httpx
+from typing import Any, Dict, Iterator, Optional, Tuple
+import io
 import json
 
+# polars is optional; when installed the sidebar offers it for CSV previews
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
 # Configure Streamlit
 st.set_page_config(
     page_title="Smart Macro Tool - Clean Architecture",
@@ -19,6 +26,13 @@ st.set_page_config(
 
 # API Configuration
 API_BASE_URL = "http://localhost:8000"
+API_TIMEOUT = 60
+
+# File extension for each export format's download
+EXPORT_EXTENSIONS = {"excel": "xlsx", "csv": "csv", "json": "json"}
+
+# Rows measured deeply when estimating a preview's memory footprint
+PREVIEW_MEMORY_SAMPLE_ROWS = 1000
 
 # Session state initialization
 if 'current_job_id' not in st.session_state:
@@ -27,13 +41,23 @@ if 'uploaded_data' not in st.session_state:
     st.session_state.uploaded_data = None
 if 'transformed_data' not in st.session_state:
     st.session_state.transformed_data = None
+if 'pending_transforms' not in st.session_state:
+    st.session_state.pending_transforms = []
+
+
+@st.cache_resource
+def get_client() -> httpx.Client:
+    """Shared HTTP client so reruns reuse pooled keep-alive connections."""
+    return httpx.Client(base_url=API_BASE_URL, timeout=API_TIMEOUT)
 
 
 def upload_file_to_api(file) -> Optional[dict]:
     """Upload file to backend API."""
     try:
-        files = {"file": (file.name, file.getvalue(), file.type)}
-        response = requests.post(f"{API_BASE_URL}/api/upload", files=files)
+        # Hand httpx the buffer itself so the body is streamed in chunks
+        file.seek(0)
+        files = {"file": (file.name, file, file.type)}
+        response = get_client().post("/api/upload", files=files)
         
         if response.status_code == 200:
             return response.json()
@@ -52,7 +76,27 @@ def transform_data_api(job_id: str, transformations: list) -> Optional[dict]:
             "job_id": job_id,
             "transformations": transformations
         }
-        response = requests.post(f"{API_BASE_URL}/api/transform", json=payload)
+        response = get_client().post("/api/transform", json=payload)
+        
+        if response.status_code == 200:
+            return response.json()
+        else:
+            st.error(f"Transformation failed: {response.text}")
+            return None
+    except Exception as e:
+        st.error(f"Error transforming data: {str(e)}")
+        return None
+
+
+def transform_batch_api(batch: list) -> Optional[list]:
+    """
+    Apply several queued transform requests via one API call.
+    
+    Returns one result per request, each with a ``status`` of success,
+    error or skipped; successful requests stay applied either way.
+    """
+    try:
+        response = get_client().post("/api/transform/batch", json=batch)
         
         if response.status_code == 200:
             return response.json()
@@ -72,7 +116,7 @@ def export_data_api(job_id: str, format: str):
             "format": format,
             "filename": f"export_{job_id}"
         }
-        response = requests.post(f"{API_BASE_URL}/api/export", json=payload)
+        response = get_client().post("/api/export", json=payload)
         
         if response.status_code == 200:
             return response.content
@@ -84,6 +128,65 @@ def export_data_api(job_id: str, format: str):
         return None
 
 
+def watch_job_api(job_id: str) -> Iterator[dict]:
+    """
+    Yield job summaries as the API pushes them, until the job finishes.
+    
+    Reads the job's server-sent event stream over the shared client
+    instead of polling the status endpoint; the server closes the stream
+    once the job reaches a terminal status.
+    """
+    with get_client().stream(
+        "GET", f"/api/jobs/{job_id}/events", timeout=None
+    ) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if line.startswith("data: "):
+                yield json.loads(line[6:])
+
+
+@st.cache_data(max_entries=4)
+def load_preview(
+    name: str, data: bytes, use_polars: bool = False
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Parse an uploaded file once per content and return its preview and stats.
+    
+    Cached on the file bytes, so widget reruns don't re-parse the file.
+    With use_polars, CSVs are parsed and summarized by polars and only the
+    preview rows are converted to pandas.
+    """
+    buffer = io.BytesIO(data)
+    if use_polars and pl is not None and name.endswith('.csv'):
+        frame = pl.read_csv(buffer)
+        stats = {
+            'rows': frame.height,
+            'columns': frame.width,
+            'nulls': sum(frame.null_count().row(0)),
+            'memory_mb': frame.estimated_size('mb'),
+        }
+        return frame.head(100).to_pandas(), stats
+    
+    if name.endswith('.csv'):
+        # pyarrow ships with Streamlit and parses CSV several times faster
+        df = pd.read_csv(buffer, engine='pyarrow')
+    else:
+        df = pd.read_excel(buffer)
+    
+    # A deep memory count walks every object cell; extrapolate from a sample
+    sample = df.head(PREVIEW_MEMORY_SAMPLE_ROWS)
+    memory = sample.memory_usage(deep=True).sum() * len(df) / max(len(sample), 1)
+    
+    stats = {
+        'rows': len(df),
+        'columns': len(df.columns),
+        'nulls': int(df.isnull().sum().sum()),
+        'memory_mb': memory / 1024**2,
+    }
+    # Only the preview rows are kept in the cache
+    return df.head(100), stats
+
+
 # Sidebar Navigation
 st.sidebar.title("📊 Smart Macro Tool")
 st.sidebar.markdown("---")
@@ -94,6 +197,12 @@ page = st.sidebar.radio(
     ["🏠 Home", "📤 Upload & Validate", "🔧 Transform", "📥 Export", "ℹ️ About"]
 )
 
+use_polars = pl is not None and st.sidebar.checkbox(
+    "⚡ Fast CSV preview (Polars)",
+    value=True,
+    help="Parse CSV previews with Polars instead of pandas"
+)
+
 # Home Page
 if page == "🏠 Home":
     st.title("Welcome to Smart Macro Tool")
@@ -172,28 +281,35 @@ elif page == "📤 Upload & Validate":
                         
                         st.success(f"✅ Upload successful!")
                         st.json(result)
+
+                        # Follow the job's status until the API reports it finished
+                        status = st.empty()
+                        try:
+                            for summary in watch_job_api(result['job_id']):
+                                status.info(f"**Job status:** {summary['status']}")
+                        except httpx.HTTPError as e:
+                            status.warning(f"Job status unavailable: {e}")
         
         # Preview
         st.markdown("---")
         st.subheader("📋 File Preview")
         
         try:
-            if uploaded_file.name.endswith('.csv'):
-                df = pd.read_csv(uploaded_file)
-            else:
-                df = pd.read_excel(uploaded_file)
+            preview, stats = load_preview(
+                uploaded_file.name, uploaded_file.getvalue(), use_polars
+            )
             
-            st.dataframe(df.head(100), use_container_width=True)
+            st.dataframe(preview, use_container_width=True)
             
             # Statistics
             st.markdown("---")
             st.subheader("📊 Data Statistics")
             
             col1, col2, col3, col4 = st.columns(4)
-            col1.metric("Rows", len(df))
-            col2.metric("Columns", len(df.columns))
-            col3.metric("Null Values", df.isnull().sum().sum())
-            col4.metric("Memory", f"{df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+            col1.metric("Rows", stats['rows'])
+            col2.metric("Columns", stats['columns'])
+            col3.metric("Null Values", stats['nulls'])
+            col4.metric("Memory (est.)", f"{stats['memory_mb']:.2f} MB")
             
         except Exception as e:
             st.error(f"Error reading file: {str(e)}")
@@ -232,19 +348,56 @@ elif page == "🔧 Transform":
         
         st.markdown("---")
         
+        transformations = ["null_cleaner"]
+        
+        if rename_cols:
+            transformations.append("column_rename")
+        if convert_types:
+            transformations.append("type_converter")
+        
+        current = {
+            "job_id": st.session_state.current_job_id,
+            "transformations": transformations
+        }
+        pending = st.session_state.pending_transforms
+        
+        if st.button("➕ Queue Transformations"):
+            pending.append(current)
+        
+        if pending:
+            st.caption(f"{len(pending)} queued, sent together with the current selection")
+            st.json(pending, expanded=False)
+        
         if st.button("✨ Apply Transformations", type="primary"):
             with st.spinner("Applying transformations..."):
-                transformations = ["null_cleaner"]
-                
-                if rename_cols:
-                    transformations.append("column_rename")
-                if convert_types:
-                    transformations.append("type_converter")
-                
-                result = transform_data_api(
-                    st.session_state.current_job_id,
-                    transformations
-                )
+                # Queued operations go out in one request; a lone one
+                # keeps using the single-transform endpoint
+                if pending:
+                    # Don't send the selection twice if it was just queued
+                    batch = pending if pending[-1] == current else pending + [current]
+                    results = transform_batch_api(batch) or []
+                    
+                    for item, outcome in zip(batch, results):
+                        if outcome["status"] == "error":
+                            st.error(
+                                f"{', '.join(item['transformations'])} failed: "
+                                f"{outcome['error']}"
+                            )
+                    
+                    # Applied requests leave the queue so a retry doesn't
+                    # re-apply them; failed and skipped ones stay queued
+                    if results:
+                        st.session_state.pending_transforms = [
+                            item for item, outcome in zip(batch, results)
+                            if outcome["status"] != "success" and item is not current
+                        ]
+                    
+                    result = results[-1] if results and results[-1]["status"] == "success" else None
+                else:
+                    result = transform_data_api(
+                        current["job_id"],
+                        current["transformations"]
+                    )
                 
                 if result:
                     st.session_state.transformed_data = result
@@ -284,8 +437,7 @@ elif page == "📥 Export":
                 
                 if content:
                     # Determine file extension
-                    ext_map = {"excel": "xlsx", "csv": "csv", "json": "json"}
-                    ext = ext_map[export_format]
+                    ext = EXPORT_EXTENSIONS[export_format]
                     
                     filename = custom_filename or f"export_{st.session_state.current_job_id}"
                     
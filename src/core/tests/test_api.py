@@ -0,0 +1,40 @@
+"""End-to-end tests for the FastAPI interface."""
+
+import json
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+from src_clean_architecture.interface.api import app
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+def test_job_events_stream_summary_after_upload(client):
+    response = client.post(
+        "/api/upload",
+        files={"file": ("data.csv", b"a,b\n1,x\n2,y\n", "text/csv")}
+    )
+    assert response.status_code == 200
+    job_id = response.json()["job_id"]
+    
+    with client.stream("GET", f"/api/jobs/{job_id}/events") as events:
+        assert events.status_code == 200
+        summaries = [
+            json.loads(line[len("data: "):])
+            for line in events.iter_lines()
+            if line.startswith("data: ")
+        ]
+    
+    assert summaries
+    assert summaries[0]["job_id"] == job_id
+    assert summaries[-1]["status"] == "complete"
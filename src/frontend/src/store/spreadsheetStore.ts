@@ -56,6 +56,7 @@ export interface SpreadsheetState {
   isDragging: boolean
   dragSource: string | null
   gridApi: GridApi | null
+  batchDepth: number
   
   // Actions
   setGridApi: (api: GridApi | null) => void
@@ -72,8 +73,10 @@ export interface SpreadsheetState {
   
   // Cell actions
   setCellValue: (fileId: string, sheetId: string, cellId: string, value: string, formula?: string) => void
+  setCellValues: (fileId: string, sheetId: string, values: [string, string][]) => void
   setCellStyle: (fileId: string, sheetId: string, cellId: string, style: Partial<CellStyle>) => void
   getCellValue: (fileId: string, sheetId: string, cellId: string) => CellData | undefined
+  getCellValues: (fileId: string, sheetId: string, cellIds: string[]) => Record<string, CellData | undefined>
   selectCells: (cellIds: string[]) => void
   clearSelection: () => void
   
@@ -98,6 +101,8 @@ export interface SpreadsheetState {
   getActiveFile: () => OpenFile | undefined
   getActiveSheet: () => Sheet | undefined
   refreshGrid: () => void
+  beginBatch: () => void
+  endBatch: () => void
 }
 
 const generateId = () => `${Date.now()}_${Math.random().toString(36).substr(2, 9)}`
@@ -141,15 +146,24 @@ export const useSpreadsheetStore = create<SpreadsheetState>()(
       isDragging: false,
       dragSource: null,
       gridApi: null,
+      batchDepth: 0,
 
       // UI actions
       setGridApi: (api) => set({ gridApi: api }),
       refreshGrid: () => {
-        const { gridApi } = get()
-        if (gridApi) {
+        const { gridApi, batchDepth } = get()
+        // Deferred until the outermost endBatch
+        if (gridApi && batchDepth === 0) {
           gridApi.refreshCells({ force: true })
         }
       },
+      beginBatch: () => set((state) => ({ batchDepth: state.batchDepth + 1 })),
+      endBatch: () => {
+        set((state) => ({ batchDepth: Math.max(0, state.batchDepth - 1) }))
+        if (get().batchDepth === 0) {
+          get().refreshGrid()
+        }
+      },
 
       // File operations
       openFile: (name, path) => {
@@ -296,6 +310,44 @@ export const useSpreadsheetStore = create<SpreadsheetState>()(
         })
       },
 
+      setCellValues: (fileId, sheetId, values) => {
+        if (values.length === 0) return
+
+        set((state) => {
+          const file = state.openFiles.find((f) => f.id === fileId)
+          if (!file) return state
+
+          const sheet = file.sheets.find((s) => s.id === sheetId)
+          if (!sheet) return state
+
+          const newCells = new Map(sheet.cells)
+          for (const [cellId, value] of values) {
+            const existing = newCells.get(cellId) || { value: '' }
+
+            let style = existing.style || {}
+            if (style.backgroundColor && !style.color) {
+              style = { ...style, color: getContrastColor(style.backgroundColor) }
+            }
+
+            newCells.set(cellId, { ...existing, value, formula: undefined, style })
+          }
+
+          return {
+            openFiles: state.openFiles.map((f) =>
+              f.id === fileId
+                ? {
+                    ...f,
+                    sheets: f.sheets.map((s) =>
+                      s.id === sheetId ? { ...s, cells: newCells } : s
+                    ),
+                    isModified: true,
+                  }
+                : f
+            ),
+          }
+        })
+      },
+
       setCellStyle: (fileId, sheetId, cellId, style) => {
         set((state) => {
           const file = state.openFiles.find((f) => f.id === fileId)
@@ -354,6 +406,26 @@ export const useSpreadsheetStore = create<SpreadsheetState>()(
         return undefined
       },
 
+      getCellValues: (fileId, sheetId, cellIds) => {
+        const result: Record<string, CellData | undefined> = {}
+        const file = get().openFiles.find((f) => f.id === fileId)
+        const sheet = file?.sheets.find((s) => s.id === sheetId)
+        
+        if (sheet && sheet.cells instanceof Map) {
+          for (const cellId of cellIds) {
+            result[cellId] = sheet.cells.get(cellId)
+          }
+          return result
+        }
+        
+        // Rehydrated (non-Map) cells go through the single-cell lookup
+        const { getCellValue } = get()
+        for (const cellId of cellIds) {
+          result[cellId] = getCellValue(fileId, sheetId, cellId)
+        }
+        return result
+      },
+
       selectCells: (cellIds) => {
         set({ selectedCells: cellIds })
         